@@ -35,6 +35,53 @@ if __name__ == "__main__":
     # Available outputs:
     print(st_nb.entries)
     print(st_nb.exits)
+
+    # Run reduce-on-the-fly Custom Indicator (one Sharpe ratio per combination)
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_reduced = run_reduced(
+            StrategyNumbaReduced,
+            data.close,
+            reduce_args=(ann_factor,),
+            to_pd_series=True,
+            param_product=True,
+            execute_kwargs=dict(n_chunks="auto", distribute="chunks", engine="pathos"),
+            **default_params
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(sharpes_reduced)
+
+    # Run bit-packed Custom Indicator (8 bars per byte) and persist it on disk
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        packed = run_packed(
+            StrategyNumbaPacked,
+            data.close,
+            param_product=True,
+            execute_kwargs=dict(n_chunks="auto", distribute="chunks", engine="pathos"),
+            **default_params
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print('Packed size:', packed.entries.nbytes + packed.exits.nbytes)
+    print('Unpacked size:', st_nb.entries.values.nbytes + st_nb.exits.values.nbytes)
+
+    # Backtest directly from packed signals (one column unpacked at a time)
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_packed = get_packed_metrics_nb(close, packed.entries, packed.exits, ann_factor)
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Check outputs
+    entries_unpacked, exits_unpacked = packed.unpack()
+    np.testing.assert_array_equal(entries_unpacked, st_nb.entries.values)
+    np.testing.assert_array_equal(exits_unpacked, st_nb.exits.values)
+    np.testing.assert_array_equal(sharpes_packed, sharpes_reduced.values)
+    assert len(packed.param_index) == st_nb.entries.shape[1]
+    # Column kernel used by the backtest (one reusable buffer)
+    buffer = np.empty(packed.n_rows, dtype=np.bool_)
+    for col in range(packed.entries.shape[1]):
+        np.testing.assert_array_equal(unpack_bits_nb(packed.entries, col, buffer), st_nb.entries.values[:, col])
+        np.testing.assert_array_equal(unpack_bits_nb(packed.exits, col, buffer), st_nb.exits.values[:, col])
     
     # Single parameter
     # ---------------
@@ -144,7 +191,197 @@ if __name__ == "__main__":
     print('Time elapsed:', timer.elapsed())
     print('Memory usage:', tracer.peak_usage())
 
- 
+    # Batched multi-window indicator kernels (one pass over close per indicator family)
+
+    windows = np.asarray(default_vbt_params["window"].value)
+    bb_mean, bb_std = bbands_bank_nb(close, windows)
+    rsi_bank = rsi_bank_nb(close, windows)
+    for j, w in enumerate(windows):
+        upper, middle, _ = vbt.indicators.nb.bbands_1d_nb(close, window=w, alpha=2.0)
+        np.testing.assert_allclose(bb_mean[:, j], middle)
+        np.testing.assert_allclose(bb_mean[:, j] + 2.0 * bb_std[:, j], upper)
+        np.testing.assert_allclose(rsi_bank[:, j], vbt.indicators.nb.rsi_1d_nb(close, window=w))
+
+    fast_windows = np.asarray(default_vbt_params["fastperiod"].value)
+    slow_windows = np.asarray(default_vbt_params["slowperiod"].value)
+    signal_windows = np.asarray(default_vbt_params["signalperiod"].value)
+    ema_windows = np.unique(np.concatenate((fast_windows, slow_windows)))
+    ema_bank = ewm_mean_bank_nb(close, ema_windows.astype(np.float64), ema_windows)
+    for fast in fast_windows:
+        for slow in slow_windows:
+            macd = ema_bank[:, np.searchsorted(ema_windows, fast)] - ema_bank[:, np.searchsorted(ema_windows, slow)]
+            signal_bank = ewm_mean_bank_nb(macd, signal_windows.astype(np.float64), signal_windows)
+            for j, signal_window in enumerate(signal_windows):
+                macd_ref, signal_ref = vbt.indicators.nb.macd_1d_nb(
+                    close, fast_window=fast, slow_window=slow, signal_window=signal_window)
+                np.testing.assert_allclose(macd, macd_ref)
+                np.testing.assert_allclose(signal_bank[:, j], signal_ref)
+
+    # NaN gaps follow the vbt recursion (the weight keeps decaying across NaN values)
+    close_gaps = close.copy()
+    close_gaps[10:15] = np.nan
+    np.testing.assert_allclose(
+        ewm_mean_bank_nb(close_gaps, np.array([12.0]), np.array([12]))[:, 0],
+        vbt.generic.nb.ewm_mean_1d_nb(close_gaps, 12, minp=12, adjust=False)
+    )
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_banked = pipeline_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            banked=True,  # <- Precompute indicator banks per chunk
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Check outputs (banks are equal to the single-window kernels up to rounding)
+    np.testing.assert_allclose(sharpes_banked, sharpes_chunked_pipeline, equal_nan=True)
+
+    # Event-driven Sharpe ratio from prefix sums (no simulation)
+
+    cumsum, cumsum_sq = get_return_sums_nb(close)
+    for params in [default_single_params, dict(default_single_params, window=5, alpha=1.5)]:
+        entries, exits = get_signals_nb(close, **params)
+        np.testing.assert_allclose(
+            prefix_sharpe_nb(entries, exits, cumsum, cumsum_sq, ann_factor),
+            get_metrics_nb(get_portfolio_nb(close, entries, exits), ann_factor)
+        )
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_prefix = pipeline_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            prefix_sharpe=True,  # <- O(trades) per combination instead of O(bars)
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Check outputs (NaN where the strategy never trades)
+    finite = ~np.isnan(sharpes_prefix)
+    np.testing.assert_allclose(sharpes_prefix[finite], sharpes_chunked_pipeline[finite])
+
+    # Sharpe stability profile (yearly buckets, from the returns of the same simulation)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        stability = pipeline_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            stability=get_stability_windows(data.index, freq="Y"),  # <- Or rolling: window=252, step=21
+            to_pd_series=True,
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(stability[stability["positive_frac"] >= 0.6].nlargest(10, "sharpe_ratio"))
+
+    # Check outputs
+    np.testing.assert_array_equal(stability["sharpe_ratio"].values, sharpes_chunked_pipeline)
+
+
+    # Per-stage profiling (counters accumulated inside the compiled code)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_profiled, breakdown = pipeline_profiled_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(breakdown)
+
+    # Check outputs
+    np.testing.assert_array_equal(sharpes_profiled, sharpes_chunked_pipeline)
+
+    # Compact sweep result (no MultiIndex)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        result = pipeline_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            to_sweep_result=True,
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+        mean_per_window = result.marginal("window")
+        heatmap = result.pairwise("fastperiod", "slowperiod", agg="max")
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(heatmap)
+    print(result.top_k(10).to_frame())
+
+    # Check outputs
+    np.testing.assert_allclose(
+        mean_per_window.values,
+        result.to_pd_series().groupby(level="window").mean().values
+    )
+
+    # Significance of the sweep winners (bootstrap and deflated Sharpe ratio)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sig = pipeline_significance_nb(close, result, ann_factor, k=10, n_resamples=5000, seed=SEED)
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(sig.p_value, sig.deflated_sharpe, sig.expected_max_sharpe)
+
+    # Check outputs (returns come from the same simulation as the sweep)
+    returns = get_sweep_returns(close, sig.params)
+    np.testing.assert_allclose(
+        returns.mean(axis=0) / returns.std(axis=0, ddof=1) * np.sqrt(ann_factor),
+        sig.sharpe
+    )
+
+    # Sample a random subset in index space (the full grid is never built)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_sampled = pipeline_chunked_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            n_samples=100,
+            sampling="lhs",  # <- "uniform", "lhs" or "sobol"
+            seed=SEED,
+            to_pd_series=True,
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(sharpes_sampled)
+
+    # Check outputs (scans with another seed or method are cached in their own files)
+    for sampling, seed in (("lhs", SEED), ("sobol", SEED + 1)):
+        sampling_kwargs = dict(n_samples=100, sampling=sampling, seed=seed, to_pd_series=True)
+        sharpes_cached = pipeline_chunked_nb(
+            close, default_vbt_params, ann_factor=ann_factor, path="temp/sharpes_sampled.pickle", **sampling_kwargs)
+        sharpes_fresh = pipeline_chunked_nb(close, default_vbt_params, ann_factor=ann_factor, **sampling_kwargs)
+        assert sharpes_cached.index.equals(sharpes_fresh.index)
+        np.testing.assert_array_equal(sharpes_cached.values, sharpes_fresh.values)
+
+    # Successive halving (multi-fidelity grid search)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        halving = pipeline_halving_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            reduction_factor=3,
+            n_rungs=3,
+            compare=True,  # <- Also run the exhaustive search to report savings
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print('Combinations evaluated per rung:', halving.n_evaluated)
+    print('Bars per rung:', halving.n_bars)
+    print('Wall time saved (seconds):', halving.time_saved)
+    print('Overlap with exhaustive top-K:', halving.top_k_overlap)
+
     # Check outputs
     np.testing.assert_array_equal(sharpes_parametrized.values, sharpes_chunked_wrapper)
     np.testing.assert_array_equal(sharpes_chunked_pipeline, sharpes_chunked_pipeline)
@@ -4,10 +4,18 @@ import vectorbtpro as vbt
 
 from vectorbtpro_templates import (
     get_data_from_csv,
+    pipeline_talib,
+    pipeline_talib_array,
     optuna_objective_talib,
+    optuna_objective_talib_array,
     optuna_objective_nb,
+    pipeline_chunked_nb,
+    search_space_params,
+    warm_start_study,
+    default_single_params,
     default_optuna_study,
-    default_optuna_optimize
+    default_optuna_optimize,
+    ExecutionPolicy
 )
 
 try:
@@ -23,6 +31,11 @@ if __name__ == "__main__":
     data = get_data_from_csv(path, sep=";")
     close = vbt.to_1d_array(data.close)
 
+    # Trials are the only parallel layer: each trial runs a single serial backtest,
+    # so all cores go to Optuna's `n_jobs` (see `examples/example_policy.py`)
+    policy = ExecutionPolicy.for_layer("trial").resolve()
+    optimize_kwargs = policy.optimize_kwargs(**default_optuna_optimize)
+
     # Instead of testing the full parameter grid, we can adopt a statistical approach.
     # There are libraries, such as Hyperopt or Optuna, that are tailored at
     # minimizing objective functions.
@@ -31,7 +44,7 @@ if __name__ == "__main__":
 
     with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
         study = optuna.create_study(**default_optuna_study)
-        study.optimize(optuna_objective_talib(data), **default_optuna_optimize)
+        study.optimize(optuna_objective_talib(data), **optimize_kwargs)
 
     print('Run Optuna Implementation')
     print('Time elapsed:', timer.elapsed())
@@ -43,11 +56,28 @@ if __name__ == "__main__":
     print(study.trials_dataframe())
     print(study.best_params)
 
+    # With TA-Lib on raw NumPy arrays (no pandas/Portfolio object per trial)
+
+    ann_factor = int(vbt.pd_acc.returns.get_ann_factor(freq='D'))
+    assert pipeline_talib(data, **default_single_params) == pipeline_talib_array(
+        close, ann_factor=ann_factor, **default_single_params)
+
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        study = optuna.create_study(**default_optuna_study)
+        study.optimize(optuna_objective_talib_array(close), **optimize_kwargs)
+
+    print('Run Optuna Implementation')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    print(study.trials_dataframe())
+    print(study.best_params)
+
     # With Numba-compiled
 
     with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
         study = optuna.create_study(**default_optuna_study)
-        study.optimize(optuna_objective_nb(close), **default_optuna_optimize)
+        study.optimize(optuna_objective_nb(close), **optimize_kwargs)
 
     print('Run Optuna Implementation')
     print('Time elapsed:', timer.elapsed())
@@ -58,3 +88,33 @@ if __name__ == "__main__":
 
     print(study.trials_dataframe())
     print(study.best_params)
+
+    # Warm start from a coarse grid sweep (top-K added as completed trials, not re-evaluated)
+
+    best_cold = study.best_value
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        result = pipeline_chunked_nb(
+            close,
+            search_space_params(stride=2),  # <- Every other value of the shared search space
+            ann_factor=ann_factor,
+            to_sweep_result=True,
+            policy=ExecutionPolicy.for_layer("chunk")
+        )
+        study = optuna.create_study(**default_optuna_study)
+        n_seeded = warm_start_study(study, result, k=20)
+        study.optimize(optuna_objective_nb(close), **dict(optimize_kwargs, n_trials=100))
+
+    print('Run Optuna Implementation (warm start)')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Number of objective evaluations to reach the best value of the cold study
+    n_evaluations, n_to_best = 0, None
+    for trial in study.trials:
+        n_evaluations += not trial.user_attrs.get("warm_start", False)
+        if trial.value is not None and trial.value >= best_cold:
+            n_to_best = n_evaluations
+            break
+    print('Seeded trials:', n_seeded)
+    print('Best value (cold / warm):', best_cold, study.best_value)
+    print('Evaluations to reach the cold best value:', n_to_best)
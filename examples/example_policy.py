@@ -0,0 +1,62 @@
+import os
+import time
+from pathlib import Path
+import optuna
+import vectorbtpro as vbt
+
+from vectorbtpro_templates import (
+    get_data_from_csv,
+    pipeline_chunked_nb,
+    optuna_objective_nb,
+    ExecutionPolicy,
+    default_vbt_params,
+    default_optuna_study,
+    default_optuna_optimize
+)
+
+try:
+    DATA_DIR = Path(__file__).resolve().parent
+except:
+    pass
+
+
+if __name__ == "__main__":
+
+    # Load historical data from CSV
+    path = DATA_DIR / "csv" / "NQ=F_ohlcv_data.csv"
+    data = get_data_from_csv(path, sep=";")
+    close = vbt.to_1d_array(data.close)
+    ann_factor = int(vbt.pd_acc.returns.get_ann_factor(freq='D'))
+
+    # Warm up Numba compilation
+    pipeline_chunked_nb(close, default_vbt_params, ann_factor, policy=ExecutionPolicy(n_cores=1))
+
+    # Scaling of the chunked sweep from 1 to N cores (chunk level)
+
+    n_cores_list = sorted({2 ** i for i in range(os.cpu_count().bit_length())} | {os.cpu_count()})
+    elapsed = {}
+    for n_cores in n_cores_list:
+        policy = ExecutionPolicy.for_layer("chunk", n_cores=n_cores)
+        start = time.perf_counter()
+        pipeline_chunked_nb(close, default_vbt_params, ann_factor, policy=policy)
+        elapsed[n_cores] = time.perf_counter() - start
+
+    print('Chunked sweep scaling')
+    for n_cores, seconds in elapsed.items():
+        print(f'{n_cores:>3d} cores: {seconds:8.2f} s (speedup {elapsed[1] / seconds:5.2f}x)')
+
+    # Scaling of Optuna from 1 to N cores (trial level)
+
+    optimize_kwargs = dict(default_optuna_optimize, n_trials=200, callbacks=None)
+    objective = optuna_objective_nb(close)
+    elapsed = {}
+    for n_cores in n_cores_list:
+        policy = ExecutionPolicy.for_layer("trial", n_cores=n_cores).resolve()
+        study = optuna.create_study(**default_optuna_study)
+        start = time.perf_counter()
+        study.optimize(objective, **policy.optimize_kwargs(**optimize_kwargs))
+        elapsed[n_cores] = time.perf_counter() - start
+
+    print('Optuna scaling')
+    for n_cores, seconds in elapsed.items():
+        print(f'{n_cores:>3d} cores: {seconds:8.2f} s (speedup {elapsed[1] / seconds:5.2f}x)')
@@ -0,0 +1,90 @@
+import time
+import multiprocessing
+from pathlib import Path
+import numpy as np
+import vectorbtpro as vbt
+
+from vectorbtpro_templates import (
+    get_data_from_csv,
+    pipeline_chunked_nb,
+    pipeline_sharded_nb,
+    run_shard_worker,
+    sweep_fingerprint,
+    ShardCoordinator,
+    default_vbt_params
+)
+
+try:
+    DATA_DIR = Path(__file__).resolve().parent
+except:
+    pass
+
+
+if __name__ == "__main__":
+
+    # Load historical data from CSV
+    path = DATA_DIR / "csv" / "NQ=F_ohlcv_data.csv"
+    data = get_data_from_csv(path, sep=";")
+    close = vbt.to_1d_array(data.close)
+    ann_factor = int(vbt.pd_acc.returns.get_ann_factor(freq='D'))
+
+    # Delete previously generated directory (if any)
+    vbt.remove_dir("temp/sweep", with_contents=True, missing_ok=True)
+
+    # Run the sweep by shards with several local worker processes.
+    # Workers on other hosts can join the same sweep with `run_shard_worker`,
+    # given the same arguments and a directory on a shared filesystem.
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_sharded = pipeline_sharded_nb(
+            close,
+            default_vbt_params,
+            ann_factor=ann_factor,
+            path="temp/sweep",
+            n_workers=4,
+            shard_len=100,
+            lease_timeout=60.0,  # <- Shards of dead workers are claimed again after 60 seconds
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Run Sharded Sweep')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(ShardCoordinator("temp/sweep").progress())
+
+    # Check outputs
+    sharpes_chunked = pipeline_chunked_nb(close, default_vbt_params, ann_factor=ann_factor)
+    np.testing.assert_array_equal(sharpes_sharded, sharpes_chunked)
+
+    # Recover from a dead worker: a worker is killed while running a shard, the live workers
+    # keep polling until its lease is stale, claim the shard again and complete the sweep
+    vbt.remove_dir("temp/sweep_recovery", with_contents=True, missing_ok=True)
+    ctx = multiprocessing.get_context("spawn")
+    doomed = ctx.Process(
+        target=run_shard_worker,
+        args=(close, default_vbt_params, ann_factor, "temp/sweep_recovery"),
+        kwargs=dict(lease_timeout=5.0, worker="doomed")
+    )
+    coordinator = ShardCoordinator("temp/sweep_recovery", lease_timeout=5.0)
+    n_params = len(sharpes_chunked)
+    shard_len = -(-n_params // 4)  # <- Large shards, so that the kill lands mid-shard
+    coordinator.create(n_params, shard_len, fingerprint=sweep_fingerprint(close, default_vbt_params, ann_factor))
+    doomed.start()
+    while coordinator.progress().get("running", 0) == 0:
+        time.sleep(0.05)
+    doomed.kill()
+    doomed.join()
+    print('Killed worker progress:', coordinator.progress())
+
+    sharpes_recovered = pipeline_sharded_nb(
+        close,
+        default_vbt_params,
+        ann_factor=ann_factor,
+        path="temp/sweep_recovery",
+        n_workers=2,
+        shard_len=shard_len,
+        lease_timeout=5.0,
+        _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+    )
+    print(ShardCoordinator("temp/sweep_recovery").progress())
+
+    # Check outputs
+    np.testing.assert_array_equal(sharpes_recovered, sharpes_chunked)
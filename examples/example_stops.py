@@ -0,0 +1,92 @@
+from pathlib import Path
+import numpy as np
+import vectorbtpro as vbt
+
+from vectorbtpro_templates import (
+    get_data_from_csv,
+    get_signals_nb,
+    pipeline_stops_nb,
+    pipeline_chunked_nb,
+    StopTemplate,
+    default_single_params,
+    default_vbt_params,
+    np_list_arange
+)
+
+try:
+    DATA_DIR = Path(__file__).resolve().parent
+except:
+    pass
+
+
+if __name__ == "__main__":
+
+    # Load historical data from CSV
+    path = DATA_DIR / "csv" / "NQ=F_ohlcv_data.csv"
+    data = get_data_from_csv(path, sep=";")
+    close = vbt.to_1d_array(data.close)
+    ann_factor = int(vbt.pd_acc.returns.get_ann_factor(freq='D'))
+
+    # Stop levels to sweep as extra grid axes
+    stop_params = StopTemplate(
+        sl_stop=np_list_arange(0.01, 0.1, 0.01),
+        tp_stop=np_list_arange(0.01, 0.1, 0.01),
+        tsl_stop=np_list_arange(0.01, 0.1, 0.01)
+    )._asdict()
+    stop_product, _ = vbt.combine_params({k: vbt.Param(v) for k, v in stop_params.items()})
+    n_stops = len(stop_product["sl_stop"])
+    entries, exits = get_signals_nb(close, **default_single_params)
+
+    # Generic path: vbt.Portfolio.from_signals with stops (from_signal_func_nb)
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        pf = vbt.Portfolio.from_signals(
+            close=close,
+            entries=entries,
+            exits=exits,
+            sl_stop=vbt.Param(stop_product["sl_stop"], level=0),
+            tp_stop=vbt.Param(stop_product["tp_stop"], level=0),
+            tsl_stop=vbt.Param(stop_product["tsl_stop"], level=0),
+            freq='D'
+        )
+        sharpes_generic = pf.sharpe_ratio.values
+    print('Run Generic Stop Simulation')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Fast path: dedicated long-only stop simulator
+    pipeline_stops_nb(close, **default_single_params, sl_stop=0.1, tp_stop=0.1, tsl_stop=0.1,
+                      ann_factor=ann_factor)  # <- Compile
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_fast = np.array([
+            pipeline_stops_nb(
+                close,
+                **default_single_params,
+                sl_stop=stop_product["sl_stop"][i],
+                tp_stop=stop_product["tp_stop"][i],
+                tsl_stop=stop_product["tsl_stop"][i],
+                ann_factor=ann_factor
+            )
+            for i in range(n_stops)
+        ])
+    print('Run Fast Stop Simulation')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Check outputs
+    np.testing.assert_allclose(sharpes_fast, sharpes_generic)
+
+    # Sweep stops together with the indicator parameters
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes = pipeline_chunked_nb(
+            close,
+            {**default_vbt_params, **{k: vbt.Param(v) for k, v in stop_params.items()}},
+            ann_factor=ann_factor,
+            n_samples=10_000,
+            seed=1234,
+            to_pd_series=True,
+            _execute_kwargs=dict(chunk_len="auto", engine="threadpool")
+        )
+    print('Run Chunked Stop Sweep')
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+    print(sharpes)
@@ -1,7 +1,16 @@
 from pathlib import Path
+import numpy as np
 import vectorbtpro as vbt
 
-from vectorbtpro_templates import get_data_from_csv, StrategyTALib, default_params
+from vectorbtpro_templates import (
+    get_data_from_csv,
+    StrategyTALib,
+    StrategyTALibReduced,
+    run_reduced,
+    run_cached,
+    IndicatorCache,
+    default_params
+)
 
 try:
     DATA_DIR = Path(__file__).resolve().parent
@@ -48,3 +57,49 @@ if __name__ == "__main__":
     # Run TA-Lib Backtest
     # Time elapsed: 1.02 seconds
     # Memory usage: 388.7 MB
+
+    # Run reduce-on-the-fly custom indicator
+    # Simulation and Sharpe ratio run inside the apply loop: entries and exits
+    # matrices are never materialized, only one float per parameter combination.
+    ann_factor = int(vbt.pd_acc.returns.get_ann_factor(freq='D'))
+    with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+        sharpes_reduced = run_reduced(
+            StrategyTALibReduced,
+            data.close,
+            reduce_args=(ann_factor,),
+            param_product=True,
+            execute_kwargs=dict(chunk_len="auto", engine="threadpool"),
+            **default_params
+        )
+
+    print("Run TA-Lib Reduced Custom Indicator")
+    print('Time elapsed:', timer.elapsed())
+    print('Memory usage:', tracer.peak_usage())
+
+    # Check outputs
+    np.testing.assert_allclose(sharpes.values, sharpes_reduced)
+
+    # Run custom indicator through the on-disk column cache
+    # Cold run (empty cache), then a run computing only the new `window` values,
+    # then a warm run assembled from the cache only
+    cache = IndicatorCache("temp/indicator_cache", max_bytes=1 << 30)
+    cache.clear()
+    st_full = StrategyTALib.run(data.close, param_product=True, **dict(default_params, window=range(5, 10)))
+    for window, st_expected in ((default_params["window"], st), (range(5, 10), st_full), (range(5, 10), st_full)):
+        with (vbt.Timer() as timer, vbt.MemTracer() as tracer):
+            st_cached = run_cached(
+                StrategyTALib,
+                data.close,
+                cache,
+                param_product=True,
+                execute_kwargs=dict(chunk_len="auto", engine="threadpool"),
+                **dict(default_params, window=window)
+            )
+        print("Run TA-Lib Custom Indicator (cached)")
+        print('Time elapsed:', timer.elapsed())
+        print('Memory usage:', tracer.peak_usage())
+        print('Cache size:', cache.size())
+
+        # Check outputs
+        np.testing.assert_array_equal(st_cached.entries.values, st_expected.entries.values)
+        np.testing.assert_array_equal(st_cached.exits.values, st_expected.exits.values)
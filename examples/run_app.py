@@ -1,10 +1,12 @@
 from pathlib import Path
+import numpy as np
 import vectorbtpro as vbt
 
 from vectorbtpro_templates import (
     get_data_from_csv,
     chunked_wrapper_nb,
     ParamTemplate,
+    ExecutionPolicy,
     np_list_arange
 )
 
@@ -23,10 +25,11 @@ param_template = ParamTemplate(
     alpha=np_list_arange(0.5, 3.6, 0.2)
 )
 
-# Adds vbt.Param to each parameter
-all_vbt_params = {
-    key: vbt.Param(value) for key, value in param_template._asdict().items()
-}
+# All cores go to the chunk level (engine threads), kernels and trials run serially
+policy = ExecutionPolicy.for_layer("chunk")
+
+# Degenerate combinations (e.g. fastperiod >= slowperiod, windows longer
+# than the data) are skipped using `ParamTemplate.constraints`
 
 
 if __name__ == "__main__":
@@ -51,15 +54,18 @@ if __name__ == "__main__":
     print('[INFO] Starting parameter combination process...')
 
     with vbt.Timer() as timer:
-        param_product, param_index = vbt.combine_params(all_vbt_params)
+        # Only valid combinations are generated (without building the full product)
+        grid = param_template.build_grid(n_bars=len(close))
+        param_product = grid.param_product
 
     # Total number of parameter combinations
-    n_params = len(param_index)
+    n_params = grid.n_params
 
-    print('[INFO] Time elapsed for combine_params:', timer.elapsed())
-    print(f"[INFO] Total number of parameter combinations: {n_params:,d}")
+    print('[INFO] Time elapsed for build_grid:', timer.elapsed())
+    print(f"[INFO] Total number of parameter combinations: {n_params:,d} (out of {int(np.prod(grid.shape)):,d})")
     print(f"[INFO] Chunk size: {100_000:,d}")
-    print('[INFO] Number of chunks [CPU cores=8]:', n_params / 100_000 / 8)
+    policy = policy.resolve()
+    print(f'[INFO] Number of chunks [CPU cores={policy.chunk_workers}]:', n_params / 100_000 / policy.chunk_workers)
     print('[INFO] Processing chunks...')
 
     with vbt.Timer() as timer, vbt.MemTracer() as tracer:
@@ -77,8 +83,8 @@ if __name__ == "__main__":
                 ann_factor=ann_factor,
                 _chunk_len=100_000, # Pass at most n parameter combinations at a time
                 # Apart from chunking the parameter arrays, we can also put chunks themselves into so-called "super chunks". 
-                # Each super chunk will consist of as many chunks as there are CPU cores - one per thread.
-                _execute_kwargs=dict(chunk_len='auto', engine="threadpool") 
+                # Each super chunk will consist of as many chunks as there are engine workers - one per thread.
+                _execute_kwargs=policy.execute_kwargs
                 # Any argument passed to the chunked decorator can be overridden
                 # during the runtime using the same argument but prefixed with
                 # an underscore _
@@ -1 +1 @@
-import warnings# Suppress warningswarnings.filterwarnings("ignore")# Import Configfrom .config import *# Import models functions from .models.talib.strategies import *from .models.talib.custom_indicators import *from .models.talib.pipelines import *from .models.nb.strategies import *from .models.nb.custom_indicators import *from .models.nb.pipelines import *from .models.optuna.objectives import *# Import loader modelsfrom .load_data import *# import utilsfrom .utils import *
\ No newline at end of file
+import warnings# Suppress warningswarnings.filterwarnings("ignore")# Import Configfrom .config import *# Import grid builder, sweep results and indicator cachefrom .grid import *from .results import *from .cache import *# Import models functions from .models.talib.strategies import *from .models.talib.custom_indicators import *from .models.talib.pipelines import *from .models.nb.strategies import *from .models.nb.indicators import *from .models.nb.custom_indicators import *from .models.nb.chunking import *from .models.nb.pipelines import *from .models.nb.stops import *from .models.nb.search import *from .models.nb.shards import *from .models.nb.profiling import *from .models.nb.significance import *from .models.optuna.objectives import *# Import loader modelsfrom .load_data import *# import utilsfrom .utils import *
\ No newline at end of file
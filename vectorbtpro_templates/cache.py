@@ -0,0 +1,190 @@
+import os
+import hashlib
+from pathlib import Path
+import numpy as np
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.grid import build_grid, _get_axes
+
+__all__ = ["IndicatorCache", "run_cached"]
+
+
+# Content-Addressed Indicator Cache
+# ---------------------------------
+# Reruns of `StrategyTALib.run`/`StrategyNumba.run` on the same close data and overlapping
+# parameter grids recompute every column. The cache stores the outputs of each column in
+# its own file, named after a SHA-256 of the indicator, the input array and the parameter
+# tuple of the column. A run only computes the missing columns (in a single indicator run)
+# and assembles the rest from disk. Hits refresh the modification time of their file, and
+# the least recently used files are evicted when the cache exceeds its size limit.
+# Note: keys do not cover the code of the apply function, clear the cache after changing it.
+
+
+class IndicatorCache:
+    """On-disk cache of indicator columns stored in `path`, limited to `max_bytes` (LRU eviction)."""
+
+    def __init__(self, path: str | Path, max_bytes: int = 1 << 30) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def data_key(self, indicator: tp.Type[vbt.IndicatorBase], close: tp.ArrayLike, extra: tp.Any = None) -> str:
+        """Hash of the indicator, the input array and any `extra` data affecting the outputs."""
+        arr = np.ascontiguousarray(np.asarray(close))
+        h = hashlib.sha256()
+        h.update(repr((indicator.__module__, indicator.__name__, tuple(indicator.output_names))).encode())
+        h.update(repr((arr.dtype.str, arr.shape, extra)).encode())
+        h.update(arr.tobytes())
+        return h.hexdigest()
+
+    def column_path(self, data_key: str, params: tp.Tuple) -> Path:
+        """File of the column with parameter tuple `params` (values in `indicator.param_names` order)."""
+        h = hashlib.sha256(data_key.encode())
+        h.update(repr(tuple(v.item() if isinstance(v, np.generic) else v for v in params)).encode())
+        return self.path / f"{h.hexdigest()}.npz"
+
+    def load(self, path: Path) -> tp.Optional[tp.List[tp.Array1d]]:
+        """Outputs of a cached column (None on a miss). A hit refreshes the LRU order."""
+        try:
+            with np.load(path) as f:
+                outputs = [f[f"arr_{i}"] for i in range(len(f.files))]
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # <- Evicted by a concurrent run in the meantime
+        return outputs
+
+    def save(self, path: Path, outputs: tp.Sequence[tp.Array1d]) -> None:
+        """Write the outputs of a column atomically."""
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, *outputs)
+        os.replace(tmp_path, path)
+
+    def size(self) -> int:
+        """Total size of the cached columns in bytes."""
+        return sum(p.stat().st_size for p in self.path.glob("*.npz"))
+
+    def evict(self) -> int:
+        """Remove the least recently used columns until the cache fits in `max_bytes`. Returns the number removed."""
+        files = []
+        for p in self.path.glob("*.npz"):
+            try:
+                stat = p.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, p))
+        total = sum(size for _, size, _ in files)
+        n_removed = 0
+        for _, size, p in sorted(files, key=lambda x: x[0]):
+            if total <= self.max_bytes:
+                break
+            p.unlink(missing_ok=True)
+            total -= size
+            n_removed += 1
+        return n_removed
+
+    def clear(self) -> None:
+        """Remove all cached columns."""
+        for p in self.path.glob("*.npz"):
+            p.unlink(missing_ok=True)
+
+
+def run_cached(
+    indicator: tp.Type[vbt.IndicatorBase],
+    close: tp.ArrayLike,
+    cache: IndicatorCache | str | Path,
+    param_product: bool = False,
+    cache_key: tp.Any = None,
+    **run_kwargs
+) -> vbt.IndicatorBase:
+    """
+    Run an indicator (e.g. `StrategyTALib`, `StrategyNumba`) through the column cache.
+
+    Only the parameter combinations missing from the cache are computed, in a single
+    indicator run. The full result is then built by the indicator from the assembled
+    raw outputs (`use_raw`), so that it is the same object as a regular run.
+
+    Parameters
+    ----------
+    indicator : tp.Type[vbt.IndicatorBase]
+        Indicator class with a single input and array outputs of one column per combination.
+    close : tp.ArrayLike
+        Close prices of a **single** asset.
+    cache : IndicatorCache | str | Path
+        Cache, or its directory (default size limit).
+    param_product : bool, optional
+        Whether to build the product of the parameter values (as in `indicator.run`),
+        by default False (values are zipped).
+    cache_key : tp.Any, optional
+        Extra data affecting the outputs (e.g. other arguments of the apply function),
+        included in the keys, by default None.
+    **run_kwargs
+        Parameters (all of `indicator.param_names`) and keyword arguments passed to `indicator.run`.
+
+    Returns
+    -------
+    vbt.IndicatorBase
+        Indicator instance with all requested columns.
+
+    Examples
+    --------
+    >>> cache = IndicatorCache("temp/indicator_cache", max_bytes=2 << 30)
+    >>> st = run_cached(StrategyTALib, data.close, cache, param_product=True, **default_params)
+    >>> st.entries, st.exits
+    """
+    if not isinstance(cache, IndicatorCache):
+        cache = IndicatorCache(cache)
+    missing = [name for name in indicator.param_names if name not in run_kwargs]
+    if missing:
+        raise ValueError(f"All parameters must be provided, missing {missing}")
+    params = {name: run_kwargs.pop(name) for name in indicator.param_names}
+
+    # Parameter tuple of each column
+    if param_product:
+        combos = build_grid(params).param_product
+        columns = [combos[name] for name in indicator.param_names]
+    else:
+        columns = np.broadcast_arrays(*_get_axes(params)[1])
+    n_cols = len(columns[0])
+    param_map = list(zip(*[c.tolist() for c in columns]))  # <- Layout of `use_raw`: one tuple per column
+    data_key = cache.data_key(indicator, close, extra=cache_key)
+    paths = [cache.column_path(data_key, param_map[i]) for i in range(n_cols)]
+
+    # Assemble cached columns
+    n_outputs = len(indicator.output_names)
+    col_outputs = [cache.load(path) for path in paths]
+    missing_cols = [i for i, outputs in enumerate(col_outputs) if outputs is None]
+
+    # Compute missing columns in a single run (values zipped)
+    if missing_cols:
+        outputs, run_param_map, _, _ = indicator.run(
+            close,
+            **{name: c[missing_cols].tolist() for name, c in zip(indicator.param_names, columns)},
+            param_product=False,
+            return_raw=True,
+            **run_kwargs
+        )
+        run_cols = {tuple(param_tuple): j for j, param_tuple in enumerate(run_param_map)}
+        for i in missing_cols:
+            j = run_cols[param_map[i]]
+            col_outputs[i] = [np.asarray(outputs[k])[:, j] for k in range(n_outputs)]
+            cache.save(paths[i], col_outputs[i])
+        cache.evict()
+
+    raw = (
+        [np.column_stack([col_outputs[i][k] for i in range(n_cols)]) for k in range(n_outputs)],
+        param_map,
+        1,
+        []
+    )
+    return indicator.run(
+        close,
+        **{name: c.tolist() for name, c in zip(indicator.param_names, columns)},
+        param_product=False,
+        use_raw=raw,
+        **run_kwargs
+    )
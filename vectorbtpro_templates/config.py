@@ -1,3 +1,7 @@
+import os
+import math
+import numba
+from contextlib import contextmanager
 import optuna
 from optuna.study import MaxTrialsCallback
 from optuna.trial import TrialState
@@ -5,6 +9,7 @@ import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
 from vectorbtpro_templates.utils import np_list_arange
+from vectorbtpro_templates.grid import ParamGrid, build_grid
 
 
 # Set seed for Optuna sampler
@@ -37,10 +42,34 @@ class ParamTemplate(tp.NamedTuple):
     alpha: tp.Iterable[float] | float
     """Defines parameters for Bollinger Bands (BBands) indicator."""
 
+    # CONSTRAINTS
+    constraints = (
+        'fastperiod < slowperiod',
+        'slowperiod <= n_bars',
+        'timeperiod <= n_bars',
+        'window <= n_bars',
+    )
+    """Skips degenerate combinations (see `build_grid`). `n_bars` is the number of bars of the data."""
+
+    def build_grid(self, *constraints: str, **constants) -> ParamGrid:
+        """Build the grid of valid parameter combinations, without materializing the full product.
+
+        Uses `ParamTemplate.constraints` if no constraints are provided."""
+        return build_grid(self._asdict(), constraints or self.constraints, **constants)
+
 
 # OPTIONAL (DEFAULT) TEMPLATES
 # ############################
 
+class StopTemplate(tp.NamedTuple):
+    """Defines fixed-percentage stop parameters (e.g. 0.05 for 5%), swept as extra grid axes.
+
+    NaN disables a stop. See `pipeline_stops_nb`."""
+    sl_stop: tp.Iterable[float] | float = float('nan')  # Stop-loss
+    tp_stop: tp.Iterable[float] | float = float('nan')  # Take-profit
+    tsl_stop: tp.Iterable[float] | float = float('nan')  # Trailing stop-loss
+
+
 class PortConfig(tp.NamedTuple):
     """Defines portfolio parameters for backtesting the strategy."""
     # https://vectorbt.pro/pvt_12537e02/api/portfolio/base/#vectorbtpro.portfolio.base.Portfolio.from_signals
@@ -72,7 +101,7 @@ class OptunaStudy(tp.NamedTuple):
 class OptunaOptimze(tp.NamedTuple):
     """Defines Optuna optimize parameters."""
     n_trials: int = 500
-    n_jobs: int = -1
+    n_jobs: int = 1  # <- Trial level of `default_execution_policy` (-1 oversubscribes with chunked trials)
     callbacks: tp.List[tp.Any] = [
         MaxTrialsCallback(100, states=(TrialState.COMPLETE,))]
     # While the n_trials argument sets the number of trials that will be run,
@@ -83,12 +112,91 @@ class OptunaOptimze(tp.NamedTuple):
     # https://optuna.readthedocs.io/en/stable/reference/generated/optuna.study.MaxTrialsCallback.html
 
 
+class ExecutionPolicy(tp.NamedTuple):
+    """Defines how a budget of CPU cores is split across the layers of parallelism.
+
+    - Trial level: concurrent Optuna trials (`n_jobs` of `study.optimize`) or shard worker processes.
+    - Chunk level: workers of the vbt execution engine (`chunked_wrapper_nb`, indicator factory runs).
+    - Kernel level: Numba threads of `parallel=True` kernels (e.g. `bootstrap_sharpe_nb`). The sweep
+      pipelines run serial kernels inside chunk workers, so this level has no effect on them.
+
+    Layers multiply: with `n_jobs=-1` trials each running a threadpool of all cores, the
+    machine runs `n_cores ** 2` threads. A layer set to None receives the rest of the budget
+    (`n_cores` divided by the other layers), at most one layer can be None."""
+    n_cores: tp.Optional[int] = None  # None -> all cores
+    trial_jobs: tp.Optional[int] = 1
+    chunk_workers: tp.Optional[int] = None
+    kernel_threads: tp.Optional[int] = 1
+
+    @classmethod
+    def for_layer(cls, layer: str, n_cores: tp.Optional[int] = None) -> "ExecutionPolicy":
+        """Give the whole budget to one layer ("trial", "chunk" or "kernel"), the others run serially."""
+        layers = dict(trial="trial_jobs", chunk="chunk_workers", kernel="kernel_threads")
+        if layer not in layers:
+            raise ValueError(f"Invalid layer: '{layer}', must be one of {tuple(layers)}")
+        return cls(n_cores=n_cores, **{field: None if key == layer else 1 for key, field in layers.items()})
+
+    def resolve(self) -> "ExecutionPolicy":
+        """Policy with the number of cores of each layer resolved, checked against the budget."""
+        n_cores = self.n_cores or os.cpu_count() or 1
+        layers = dict(trial_jobs=self.trial_jobs, chunk_workers=self.chunk_workers, kernel_threads=self.kernel_threads)
+        rest = [field for field, n in layers.items() if n is None]
+        if len(rest) > 1:
+            raise ValueError(f"At most one layer can receive the rest of the budget, got {rest}")
+        n_used = math.prod(n for n in layers.values() if n is not None)
+        if rest:
+            layers[rest[0]] = max(1, n_cores // n_used)
+            n_used *= layers[rest[0]]
+        if n_used > n_cores:
+            raise ValueError(f"Layers use {n_used} cores, which exceeds the budget of {n_cores}")
+        return self._replace(n_cores=n_cores, **layers)
+
+    @contextmanager
+    def apply(self) -> tp.Iterator["ExecutionPolicy"]:
+        """Set the number of Numba threads of the calling thread to the kernel level, yield the
+        resolved policy and restore the previous number of threads on exit.
+
+        The Numba thread mask is thread-local: kernels launched from chunk workers must call
+        `numba.set_num_threads(policy.kernel_threads)` themselves (or receive it as argument).
+
+        Examples
+        --------
+        >>> with ExecutionPolicy.for_layer("kernel").apply() as policy:
+        ...     boot_sharpes = bootstrap_sharpe_nb(returns, 1000, 20.0, True, ann_factor, SEED)
+        """
+        policy = self.resolve()
+        old_threads = numba.get_num_threads()
+        numba.set_num_threads(min(policy.kernel_threads, numba.config.NUMBA_NUM_THREADS))
+        try:
+            yield policy
+        finally:
+            numba.set_num_threads(old_threads)
+
+    @property
+    def execute_kwargs(self) -> tp.Kwargs:
+        """Execution arguments of the vbt engine (`execute_kwargs` of the indicator factory and @chunked)."""
+        n_workers = self.resolve().chunk_workers
+        if n_workers == 1:
+            return dict(engine="serial")
+        return dict(engine="threadpool", chunk_len=n_workers, init_kwargs=dict(max_workers=n_workers))
+
+    def chunked_kwargs(self, **exe_kwargs) -> tp.Kwargs:
+        """Merge the engine arguments of the policy into the keyword arguments of a @chunked function."""
+        return dict(exe_kwargs, _execute_kwargs=vbt.merge_dicts(self.execute_kwargs, exe_kwargs.get("_execute_kwargs")))
+
+    def optimize_kwargs(self, **optimize_kwargs) -> tp.Kwargs:
+        """Arguments of `study.optimize` with `n_jobs` set to the trial level."""
+        return dict(optimize_kwargs, n_jobs=self.resolve().trial_jobs)
+
+
 # Parameter Names
 # ---------------
 
 
 param_names = list(ParamTemplate._fields)
 
+stop_param_names = list(StopTemplate._fields)
+
 
 # Default Parameters (HELPERS)
 # ----------------------------
@@ -117,4 +225,6 @@ default_vbt_params = {key: vbt.Param(value) for key, value in default_params.ite
 
 default_optuna_study = OptunaStudy()._asdict()
 
-default_optuna_optimize = OptunaOptimze()._asdict()
+default_execution_policy = ExecutionPolicy()  # <- All cores at the chunk level, used by entry points without `policy`
+
+default_optuna_optimize = default_execution_policy.optimize_kwargs(**OptunaOptimze()._asdict())
@@ -0,0 +1,318 @@
+import re
+import operator
+import numpy as np
+import pandas as pd
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+__all__ = ["ParamConstraint", "ParamGrid", "build_grid", "sample_grid"]
+
+
+# Constraint-Aware Parameter Grid
+# -------------------------------
+# `vbt.combine_params` builds the full Cartesian product. Many combinations are
+# meaningless (e.g. `fastperiod >= slowperiod` for MACD, windows longer than the data)
+# and still go through the whole backtest. Constraints are enforced while walking the
+# product axis by axis, pruning every branch as soon as a constraint fails, so that
+# only valid combinations are ever stored.
+
+
+_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+_CONSTRAINT_RE = re.compile(r"^\s*(\w+)\s*(<=|>=|==|!=|<|>)\s*([\w.+-]+)\s*$")
+
+
+class ParamConstraint(tp.NamedTuple):
+    """Declarative constraint between a parameter and another parameter or a constant."""
+    left: str
+    op: str
+    right: str | float
+
+    @classmethod
+    def parse(cls, constraint: tp.Union[str, "ParamConstraint"]) -> "ParamConstraint":
+        """Parse a constraint such as `"fastperiod < slowperiod"` or `"window <= n_bars"`."""
+        if isinstance(constraint, cls):
+            return constraint
+        match = _CONSTRAINT_RE.match(constraint)
+        if match is None:
+            raise ValueError(f"Invalid constraint: '{constraint}'")
+        left, op, right = match.groups()
+        try:
+            right = float(right)
+        except ValueError:
+            pass
+        return cls(left, op, right)
+
+
+class ParamGrid(tp.NamedTuple):
+    """Parameter grid restricted to valid combinations.
+
+    `index` holds the flat (C-order) position of each valid combination in the full
+    Cartesian product of `values`, which is all that is needed to recover its parameters."""
+    names: tp.List[str]
+    values: tp.List[tp.Array1d]
+    index: tp.Array1d
+
+    @property
+    def shape(self) -> tp.Tuple[int, ...]:
+        """Shape of the full Cartesian product."""
+        return tuple(len(v) for v in self.values)
+
+    @property
+    def n_params(self) -> int:
+        """Number of valid parameter combinations."""
+        return len(self.index)
+
+    @property
+    def param_product(self) -> tp.Dict[str, tp.Array1d]:
+        """Parameter values of each valid combination (same layout as `vbt.combine_params`)."""
+        axes = np.unravel_index(self.index, self.shape)
+        return {name: values[ax] for name, values, ax in zip(self.names, self.values, axes)}
+
+    @property
+    def param_index(self) -> pd.MultiIndex:
+        """Multi-index of the valid parameter combinations."""
+        axes = np.unravel_index(self.index, self.shape)
+        return pd.MultiIndex.from_arrays(
+            [values[ax] for values, ax in zip(self.values, axes)],
+            names=self.names
+        )
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def constrained_product_nb(
+    shape: tp.Array1d,
+    valid: tp.Array2d,
+    pair_axes: tp.Array2d,
+    allowed: tp.Array3d
+) -> tp.Array1d:
+    """Flat indices of the Cartesian product combinations satisfying all constraints.
+
+    Walks the product depth-first (first axis outermost): a branch is pruned as soon as
+    a value is filtered out by `valid` (per-axis constraints) or a pair of values is
+    filtered out by `allowed` (pairwise constraints between `pair_axes[c, 0] < pair_axes[c, 1]`)."""
+    n_axes = shape.shape[0]
+    n_pairs = pair_axes.shape[0]
+    out = np.empty(1024, dtype=np.int64)
+    n = 0
+    idx = np.zeros(n_axes, dtype=np.int64)
+    idx[0] = -1
+    k = 0
+    while k >= 0:
+        idx[k] += 1
+        if idx[k] >= shape[k]:
+            k -= 1
+            continue
+        if not valid[k, idx[k]]:
+            continue
+        ok = True
+        for c in range(n_pairs):
+            if pair_axes[c, 1] == k and not allowed[c, idx[pair_axes[c, 0]], idx[k]]:
+                ok = False
+                break
+        if not ok:
+            continue
+        if k < n_axes - 1:
+            k += 1
+            idx[k] = -1
+            continue
+        if n == out.shape[0]:
+            new_out = np.empty(2 * n, dtype=np.int64)
+            new_out[:n] = out
+            out = new_out
+        flat = 0
+        for a in range(n_axes):
+            flat = flat * shape[a] + idx[a]
+        out[n] = flat
+        n += 1
+    return out[:n].copy()
+
+
+def _get_axes(params: tp.Dict[str, tp.Any]) -> tp.Tuple[tp.List[str], tp.List[tp.Array1d]]:
+    """Parameter names and per-axis values (iterables, scalars or `vbt.Param`)."""
+    names = list(params)
+    values = [
+        np.atleast_1d(np.asarray(v.value if isinstance(v, vbt.Param) else v))
+        for v in params.values()
+    ]
+    return names, values
+
+
+def _compile_constraints(
+    names: tp.List[str],
+    values: tp.List[tp.Array1d],
+    constraints: tp.Sequence[str | ParamConstraint],
+    constants: tp.Dict[str, tp.Any]
+) -> tp.Tuple[tp.Array2d, tp.Array2d, tp.Array3d]:
+    """Compile constraints into per-axis masks `valid` and pairwise masks `allowed` over value positions."""
+    max_len = max(len(v) for v in values)
+    valid = np.zeros((len(names), max_len), dtype=np.bool_)
+    for a, v in enumerate(values):
+        valid[a, :len(v)] = True
+    pair_axes = []
+    allowed = []
+
+    for constraint in map(ParamConstraint.parse, constraints):
+        if constraint.left not in names:
+            raise ValueError(f"Unknown parameter '{constraint.left}' in constraint {constraint}")
+        op = _OPERATORS[constraint.op]
+        a = names.index(constraint.left)
+        left = values[a]
+        if constraint.right in names:
+            b = names.index(constraint.right)
+            right = values[b]
+            if a == b:
+                valid[a, :len(left)] &= op(left, right)
+                continue
+            mask = np.zeros((max_len, max_len), dtype=np.bool_)
+            mask[:len(left), :len(right)] = op(left[:, None], right[None, :])
+            if a > b:
+                a, b, mask = b, a, mask.T
+            pair_axes.append((a, b))
+            allowed.append(mask)
+        else:
+            if isinstance(constraint.right, str):
+                if constraint.right not in constants:
+                    raise ValueError(f"Unknown parameter or constant '{constraint.right}' in constraint {constraint}")
+                right = constants[constraint.right]
+            else:
+                right = constraint.right
+            valid[a, :len(left)] &= op(left, right)
+
+    return (
+        valid,
+        np.array(pair_axes, dtype=np.int64).reshape(-1, 2),
+        np.array(allowed, dtype=np.bool_).reshape(-1, max_len, max_len)
+    )
+
+
+def build_grid(
+    params: tp.Dict[str, tp.Any],
+    constraints: tp.Sequence[str | ParamConstraint] = (),
+    **constants
+) -> ParamGrid:
+    """
+    Build a parameter grid that only contains combinations satisfying all constraints,
+    without materializing the full Cartesian product.
+
+    Parameters
+    ----------
+    params : tp.Dict[str, tp.Any]
+        Parameter values by name (iterables, scalars or `vbt.Param`).
+    constraints : tp.Sequence[str | ParamConstraint], optional
+        Constraints such as `"fastperiod < slowperiod"`. The right-hand side can be
+        another parameter, a number or the name of a keyword argument in `constants`,
+        by default ().
+    **constants
+        Named constants referenced by constraints (e.g. `n_bars=len(close)`).
+
+    Returns
+    -------
+    ParamGrid
+        Parameter names, per-axis values and flat indices of valid combinations.
+
+    Examples
+    --------
+    >>> grid = build_grid(default_params, ["fastperiod < slowperiod", "window <= n_bars"], n_bars=len(close))
+    >>> grid.param_product  # <- Same layout as `vbt.combine_params`
+    """
+    names, values = _get_axes(params)
+    valid, pair_axes, allowed = _compile_constraints(names, values, constraints, constants)
+    shape = np.array([len(v) for v in values], dtype=np.int64)
+    index = constrained_product_nb(shape, valid, pair_axes, allowed)
+    return ParamGrid(names=names, values=values, index=index)
+
+
+def sample_grid(
+    params: tp.Dict[str, tp.Any],
+    n: int,
+    method: str = "uniform",
+    seed: tp.Optional[int] = None,
+    constraints: tp.Sequence[str | ParamConstraint] = (),
+    **constants
+) -> ParamGrid:
+    """
+    Draw a subset of parameter combinations directly in index space.
+
+    Memory and setup time scale with `n`, not with the size of the grid, which is
+    never built (e.g. quick scans of 10^9-point spaces).
+
+    Parameters
+    ----------
+    params : tp.Dict[str, tp.Any]
+        Parameter values by name (iterables, scalars or `vbt.Param`).
+    n : int
+        Number of combinations to draw.
+    method : str, optional
+        Sampling method, by default "uniform":
+
+        - "uniform": combinations drawn uniformly without replacement.
+        - "lhs": Latin hypercube, each axis is stratified into `n` strata.
+        - "sobol": scrambled Sobol sequence (requires `scipy`). The sequence is only balanced
+          for powers of two, thus `n` is rounded up to the next power of two.
+    seed : int, optional
+        Seed of the random generator, by default None.
+    constraints : tp.Sequence[str | ParamConstraint], optional
+        Constraints (see `build_grid`). Drawn combinations violating them are dropped,
+        by default ().
+    **constants
+        Named constants referenced by constraints (e.g. `n_bars=len(close)`).
+
+    Returns
+    -------
+    ParamGrid
+        Parameter names, per-axis values and sorted, unique flat indices of drawn combinations.
+        Quasi-random methods may draw the same combination twice on short axes, and
+        constraints may drop combinations, thus fewer than `n` combinations can be returned
+        (or up to the next power of two with "sobol").
+
+    Examples
+    --------
+    >>> grid = sample_grid(default_params, 1_000, method="sobol", seed=SEED)
+    >>> grid.param_product  # <- Same layout as `vbt.combine_params`
+    """
+    names, values = _get_axes(params)
+    shape = tuple(len(v) for v in values)
+    total = int(np.prod(shape, dtype=object))
+    if total > np.iinfo(np.int64).max:
+        raise ValueError("Grid is too large to be indexed with int64")
+    if n < 1:
+        raise ValueError("Number of combinations to draw must be positive")
+    rng = np.random.default_rng(seed)
+
+    if method == "uniform":
+        flat = rng.choice(total, size=min(n, total), replace=False)
+        axes = np.unravel_index(flat, shape)
+    elif method in ("lhs", "sobol"):
+        if method == "lhs":
+            u = (rng.permuted(np.tile(np.arange(n), (len(shape), 1)), axis=1).T + rng.random((n, len(shape)))) / n
+        else:
+            from scipy.stats import qmc
+
+            u = qmc.Sobol(d=len(shape), scramble=True, seed=rng).random_base2(int(n - 1).bit_length())
+        axes = tuple(
+            np.minimum((u[:, a] * length).astype(np.int64), length - 1)
+            for a, length in enumerate(shape)
+        )
+    else:
+        raise ValueError(f"Invalid sampling method: '{method}'")
+
+    if len(constraints) > 0:
+        valid, pair_axes, allowed = _compile_constraints(names, values, constraints, constants)
+        mask = np.ones(len(axes[0]), dtype=np.bool_)
+        for a, ax in enumerate(axes):
+            mask &= valid[a, ax]
+        for c, (a, b) in enumerate(pair_axes):
+            mask &= allowed[c, axes[a], axes[b]]
+        axes = tuple(ax[mask] for ax in axes)
+
+    index = np.unique(np.ravel_multi_index(axes, shape))
+    return ParamGrid(names=names, values=values, index=index)
@@ -0,0 +1,80 @@
+import numpy as np
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import default_execution_policy, param_names
+
+__all__ = ["get_param_arrays_nb", "make_chunked"]
+
+
+# Chunked Pipeline Builders
+# -------------------------
+# Every mode of the chunked pipeline (banked, prefix sums, stability, stops, profiling)
+# takes the same arguments as `chunked_func_nb` plus a few of its own, and is split into
+# chunks the same way: `n_params` is counted, the parameter arrays are sliced and the
+# other arguments are passed whole to every chunk. The helpers below share this plumbing,
+# so that a new mode only adds its kernel.
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_param_arrays_nb(
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike
+) -> tp.Tuple[tp.Array1d, tp.Array1d, tp.Array1d, tp.Array1d, tp.Array1d, tp.Array1d]:
+    """Convert the parameters of a chunk to one-dimensional arrays for `vbt.flex_select_1d_nb`."""
+    return (
+        vbt.to_1d_array_nb(np.asarray(fastperiod)),
+        vbt.to_1d_array_nb(np.asarray(slowperiod)),
+        vbt.to_1d_array_nb(np.asarray(signalperiod)),
+        vbt.to_1d_array_nb(np.asarray(timeperiod)),
+        vbt.to_1d_array_nb(np.asarray(window)),
+        vbt.to_1d_array_nb(np.asarray(alpha)),
+    )
+
+
+def make_chunked(
+    func: tp.Callable,
+    sliced_args: tp.Sequence[str] = (),
+    whole_args: tp.Sequence[str] = (),
+    merge_func: tp.Union[str, tp.Callable] = "concat"
+) -> tp.Callable:
+    """
+    Wrap a chunked function with the @chunked decorator (see `chunked_wrapper_nb`).
+
+    Parameters
+    ----------
+    func : tp.Callable
+        Numba function taking `n_params`, `close`, the parameters of `param_names`
+        and `ann_factor`, plus the arguments below.
+    sliced_args : tp.Sequence[str], optional
+        Extra per-combination arguments, sliced like the parameters (e.g. stop levels).
+    whole_args : tp.Sequence[str], optional
+        Extra arguments passed whole to every chunk (e.g. stability sub-periods).
+    merge_func : str | tp.Callable, optional
+        How chunk results are merged, by default "concat".
+
+    Returns
+    -------
+    tp.Callable
+        Chunked function. Engine defaults follow `default_execution_policy`, and can be
+        overridden at runtime with `_execute_kwargs`.
+    """
+    return vbt.chunked(
+        func,
+        size=vbt.ArgSizer(arg_query="n_params"),
+        arg_take_spec=dict(
+            n_params=vbt.CountAdapter(),
+            close=None,
+            ann_factor=None,
+            **{name: None for name in whole_args},
+            **{name: vbt.FlexArraySlicer() for name in list(param_names) + list(sliced_args)}
+        ),
+        chunk_len='auto',
+        merge_func=merge_func,
+        execute_kwargs=default_execution_policy.execute_kwargs,
+    )
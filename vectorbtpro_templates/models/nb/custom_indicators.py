@@ -1,9 +1,14 @@
 import vectorbtpro as vbt
 
-from vectorbtpro_templates.models.nb.strategies import get_signals_nb
+from vectorbtpro_templates.models.nb.strategies import (
+    get_signals_nb,
+    reduce_signals_nb,
+    get_packed_signals_nb
+)
+from vectorbtpro_templates.models.nb.pipelines import reduce_sharpe_nb
 from vectorbtpro_templates.config import param_names
 
-__all__ = ["StrategyNumba"]
+__all__ = ["StrategyNumba", "StrategyNumbaReduced", "StrategyNumbaPacked"]
 
 
 # Strategy Configuration with Indicator Factory
@@ -24,3 +29,35 @@ StrategyNumba = vbt.IF(
 """Defines a strategy using the vbt `IndicatorFactory` using Numba-compiled functions for custom indicators, enabling parameterized optimization.
 
 Source: https://vectorbt.pro/pvt_1606a55a/tutorials/superfast-supertrend/#indicator-factory"""
+
+
+StrategyNumbaReduced = vbt.IF(
+    class_name='StrategyNumbaReduced',
+    short_name='st_nb_reduced',
+    input_names=['close'],
+    param_names=param_names,
+    output_names=['metric']
+).with_apply_func(
+    reduce_signals_nb,  # <- Numba
+    takes_1d=True,  # <- Single asset
+    reduce_func_nb=reduce_sharpe_nb,  # <- Default reducer (simulation + Sharpe ratio)
+)
+"""Defines a reduce-on-the-fly strategy: signals are reduced to one metric per parameter combination
+inside the apply loop, so that the entry and exit matrices never exist in memory.
+
+Must be run with `return_raw=True` (see `run_reduced`), since the output has one row instead of one per bar."""
+
+
+StrategyNumbaPacked = vbt.IF(
+    class_name='StrategyNumbaPacked',
+    short_name='st_nb_packed',
+    input_names=['close'],
+    param_names=param_names,
+    output_names=['entries', 'exits']
+).with_apply_func(
+    get_packed_signals_nb,  # <- Numba
+    takes_1d=True,  # <- Single asset
+)
+"""Defines a strategy emitting bit-packed entry and exit signals (8x smaller than boolean matrices).
+
+Must be run with `return_raw=True` (see `run_packed`), since outputs have `(n_bars + 7) // 8` rows."""
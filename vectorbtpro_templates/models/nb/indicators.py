@@ -0,0 +1,137 @@
+import numpy as np
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+__all__ = [
+    "ewm_mean_bank_nb",
+    "rolling_mean_std_bank_nb",
+    "rsi_bank_nb",
+    "bbands_bank_nb",
+]
+
+
+# Batched Multi-Window Indicator Kernels
+# --------------------------------------
+# `get_signals_nb` computes `macd_1d_nb`, `rsi_1d_nb` and `bbands_1d_nb` for one window
+# at a time, reading `close` once per window. The kernels below take a vector of windows
+# and return a (bars x windows) block in a single traversal of the input: the outer loop
+# runs over bars and the inner loop updates the running state of every window.
+# They follow the vbt defaults of the single-window kernels (`minp=window`, `adjust=False`,
+# exponential MACD, Wilder RSI, simple BBANDS with `ddof=0`).
+# Source: https://vectorbt.pro/pvt_1606a55a/api/indicators/nb/
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def ewm_mean_bank_nb(arr: tp.Array1d, spans: tp.Array1d, minps: tp.Array1d) -> tp.Array2d:
+    """Exponential weighted mean (`adjust=False`) of `arr` for every span, in one pass.
+
+    Same recursion as `vbt.generic.nb.ewm_mean_1d_nb`, including NaN values: they are not
+    counted as observations, but the weight of the running average keeps decaying across them."""
+    n = arr.shape[0]
+    k = spans.shape[0]
+    out = np.empty((n, k), dtype=vbt.float_)
+    alpha = np.empty(k, dtype=vbt.float_)
+    for j in range(k):
+        alpha[j] = 2.0 / (spans[j] + 1.0)
+    weighted_avg = np.full(k, np.nan, dtype=vbt.float_)
+    old_wt = np.ones(k, dtype=vbt.float_)
+    nobs = 0
+
+    for i in range(n):
+        cur = arr[i]
+        is_observation = not np.isnan(cur)
+        if is_observation:
+            nobs += 1
+        for j in range(k):
+            if not np.isnan(weighted_avg[j]):
+                # Without NaN gaps, same as (1 - alpha) * avg + alpha * cur
+                old_wt[j] *= 1.0 - alpha[j]
+                if is_observation:
+                    if weighted_avg[j] != cur:
+                        weighted_avg[j] = (old_wt[j] * weighted_avg[j] + alpha[j] * cur) / (old_wt[j] + alpha[j])
+                    old_wt[j] = 1.0
+            elif is_observation:
+                weighted_avg[j] = cur
+            out[i, j] = weighted_avg[j] if nobs >= minps[j] else np.nan
+    return out
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def rolling_mean_std_bank_nb(
+    arr: tp.Array1d,
+    windows: tp.Array1d,
+    ddof: int = 0
+) -> tp.Tuple[tp.Array2d, tp.Array2d]:
+    """Rolling mean and standard deviation of `arr` for every window, in one pass.
+
+    Running sums and sums of squares are shared across windows: each bar adds the new
+    value once and removes the value leaving each window (`minp=window`). Raises ValueError
+    if `arr` contains NaN, which `vbt.generic.nb.rolling_mean_1d_nb` would skip instead."""
+    n = arr.shape[0]
+    k = windows.shape[0]
+    mean = np.empty((n, k), dtype=vbt.float_)
+    std = np.empty((n, k), dtype=vbt.float_)
+    cumsum = np.zeros(k, dtype=vbt.float_)
+    cumsum_sq = np.zeros(k, dtype=vbt.float_)
+
+    for i in range(n):
+        value = arr[i]
+        if np.isnan(value):
+            raise ValueError("rolling_mean_std_bank_nb does not support NaN values")
+        for j in range(k):
+            w = windows[j]
+            cumsum[j] += value
+            cumsum_sq[j] += value ** 2
+            if i >= w:
+                pre_value = arr[i - w]
+                cumsum[j] -= pre_value
+                cumsum_sq[j] -= pre_value ** 2
+            if i + 1 < w:
+                mean[i, j] = np.nan
+                std[i, j] = np.nan
+            else:
+                m = cumsum[j] / w
+                mean[i, j] = m
+                std[i, j] = np.sqrt(np.abs(cumsum_sq[j] - 2 * cumsum[j] * m + w * m ** 2) / (w - ddof))
+    return mean, std
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def rsi_bank_nb(close: tp.Array1d, windows: tp.Array1d) -> tp.Array2d:
+    """Wilder RSI of `close` for every window, in one pass over gains and losses."""
+    n = close.shape[0]
+    k = windows.shape[0]
+    up = np.empty(n, dtype=vbt.float_)
+    down = np.empty(n, dtype=vbt.float_)
+    up[0] = np.nan
+    down[0] = np.nan
+    for i in range(1, n):
+        delta = close[i] - close[i - 1]
+        up[i] = delta if delta > 0 else 0.0
+        down[i] = -delta if delta < 0 else 0.0
+    # Wilder smoothing with period `w` is an exponential smoothing with span `2 * w - 1`
+    spans = 2 * windows - 1
+    avg_up = ewm_mean_bank_nb(up, spans, windows)
+    avg_down = ewm_mean_bank_nb(down, spans, windows)
+
+    out = np.empty((n, k), dtype=vbt.float_)
+    for i in range(n):
+        for j in range(k):
+            u = avg_up[i, j]
+            d = avg_down[i, j]
+            if np.isnan(u) or np.isnan(d):
+                out[i, j] = np.nan
+            elif d == 0:
+                out[i, j] = 100.0 if u > 0 else np.nan
+            else:
+                out[i, j] = 100.0 - 100.0 / (1.0 + u / d)
+    return out
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def bbands_bank_nb(close: tp.Array1d, windows: tp.Array1d) -> tp.Tuple[tp.Array2d, tp.Array2d]:
+    """Middle band and standard deviation of the Bollinger Bands for every window.
+
+    Bands of any `alpha` are then `middle +/- alpha * std`, without another pass over `close`."""
+    return rolling_mean_std_bank_nb(close, windows, ddof=0)
@@ -1,3 +1,5 @@
+import hashlib
+import numbers
 from pathlib import Path
 import pandas as pd
 import numpy as np
@@ -5,16 +7,36 @@ import numba as nb
 import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
-from vectorbtpro_templates.config import param_names
-from vectorbtpro_templates.models.nb.strategies import get_signals_nb
+from vectorbtpro_templates.config import ExecutionPolicy, default_execution_policy, param_names, stop_param_names
+from vectorbtpro_templates.grid import build_grid, sample_grid
+from vectorbtpro_templates.results import SweepResult
+from vectorbtpro_templates.models.nb.strategies import get_signals_nb, strategy_nb
+from vectorbtpro_templates.models.nb.indicators import ewm_mean_bank_nb, rsi_bank_nb, bbands_bank_nb
+from vectorbtpro_templates.models.nb.chunking import get_param_arrays_nb, make_chunked
+from vectorbtpro_templates.models.nb.stops import chunked_stops_wrapper_nb
+from vectorbtpro_templates.utils import unpack_bits_nb
 
 
 __all__ = [
     "get_portfolio_nb",
     "get_metrics_nb",
+    "reduce_sharpe_nb",
     "pipeline_nb",
+    "get_packed_metrics_nb",
+    "get_return_sums_nb",
+    "prefix_sharpe_nb",
     "chunked_func_nb",
     "chunked_wrapper_nb",
+    "chunked_banked_func_nb",
+    "chunked_banked_wrapper_nb",
+    "chunked_prefix_func_nb",
+    "chunked_prefix_wrapper_nb",
+    "STABILITY_FIELDS",
+    "get_mode_path",
+    "get_stability_windows",
+    "stability_stats_nb",
+    "chunked_stability_func_nb",
+    "chunked_stability_wrapper_nb",
     "pipeline_chunked_nb",
 ]
 
@@ -70,6 +92,20 @@ def get_metrics_nb(sim_out: tp.NamedTuple, ann_factor: int) -> float:
     return sharpes
 
 
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def reduce_sharpe_nb(
+    close: tp.Array1d,
+    entries: tp.Array1d,
+    exits: tp.Array1d,
+    ann_factor: int
+) -> float:
+    """Reduce entry and exit signals to a Sharpe ratio (simulation plus metric).
+
+    Default reducer of `StrategyNumbaReduced` and `StrategyTALibReduced`."""
+    sim_out = get_portfolio_nb(close, entries, exits)
+    return get_metrics_nb(sim_out, ann_factor)
+
+
 @nb.njit(nogil=True)  # <- nogil enabled allows multithreading
 def pipeline_nb(
     close: tp.Array1d,
@@ -90,6 +126,94 @@ def pipeline_nb(
     return get_metrics_nb(sim_out, ann_factor)
 
 
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_packed_metrics_nb(
+    close: tp.Array1d,
+    packed_entries: tp.Array2d,
+    packed_exits: tp.Array2d,
+    ann_factor: int
+) -> tp.Array1d:
+    """Backtest **multiple** strategies directly from bit-packed signal matrices (see `run_packed`).
+
+    Each column is unpacked into a pair of reusable buffers right before its simulation,
+    so that the whole boolean matrix is never materialized."""
+    n_cols = packed_entries.shape[1]
+    entries = np.empty(close.shape[0], dtype=np.bool_)
+    exits = np.empty(close.shape[0], dtype=np.bool_)
+    metrics = np.empty(n_cols, dtype=vbt.float_)
+
+    for col in range(n_cols):
+        unpack_bits_nb(packed_entries, col, entries)
+        unpack_bits_nb(packed_exits, col, exits)
+        sim_out = get_portfolio_nb(close, entries, exits)
+        metrics[col] = get_metrics_nb(sim_out, ann_factor)
+    return metrics
+
+
+# Event-Driven Sharpe Ratio from Prefix Sums
+# ------------------------------------------
+# In the all-in long-only case simulated by `get_portfolio_nb` (no fees), the return of
+# a bar is zero when flat, zero on the entry bar, and the close-to-close return
+# `close[i] / close[i - 1] - 1` from the bar after the entry up to the exit bar included.
+# The sum and sum of squares of the returns are thus sums of prefix-sum differences over
+# trades, and the Sharpe ratio (ddof=1, over all bars) only costs O(trades) arithmetic
+# once the trades are found. Signals are read with the semantics of `from_basic_signals_nb`:
+# an entry when flat opens a position, an exit when in a position closes it, and a bar
+# with both signals is ignored.
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_return_sums_nb(close: tp.Array1d) -> tp.Tuple[tp.Array1d, tp.Array1d]:
+    """Prefix sums of the close-to-close returns and of their squares.
+
+    `cumsum[i]` is the sum of the returns of bars `1..i` (`cumsum[0] = 0`)."""
+    cumsum = np.zeros(close.shape[0], dtype=vbt.float_)
+    cumsum_sq = np.zeros(close.shape[0], dtype=vbt.float_)
+    for i in range(1, close.shape[0]):
+        ret = close[i] / close[i - 1] - 1
+        cumsum[i] = cumsum[i - 1] + ret
+        cumsum_sq[i] = cumsum_sq[i - 1] + ret ** 2
+    return cumsum, cumsum_sq
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def prefix_sharpe_nb(
+    entries: tp.Array1d,
+    exits: tp.Array1d,
+    cumsum: tp.Array1d,
+    cumsum_sq: tp.Array1d,
+    ann_factor: int
+) -> float:
+    """Sharpe ratio of a **single** strategy from its trades (same as `get_metrics_nb` on `get_portfolio_nb`).
+
+    `cumsum` and `cumsum_sq` come from `get_return_sums_nb`. Returns NaN if the returns have
+    no variance (e.g. no trade)."""
+    n = entries.shape[0]
+    total = 0.0
+    total_sq = 0.0
+    entry_i = -1
+    for i in range(n):
+        if entry_i == -1:
+            if entries[i] and not exits[i]:
+                entry_i = i
+        elif exits[i] and not entries[i]:
+            total += cumsum[i] - cumsum[entry_i]
+            total_sq += cumsum_sq[i] - cumsum_sq[entry_i]
+            entry_i = -1
+    if entry_i != -1:
+        # Position still open at the last bar
+        total += cumsum[n - 1] - cumsum[entry_i]
+        total_sq += cumsum_sq[n - 1] - cumsum_sq[entry_i]
+
+    if n < 2:
+        return np.nan
+    mean = total / n
+    var = (total_sq - n * mean ** 2) / (n - 1)
+    if var <= 0:
+        return np.nan
+    return mean / np.sqrt(var) * np.sqrt(ann_factor)
+
+
 @nb.njit(nogil=True)  # <- nogil enabled allows multithreading
 def chunked_func_nb(
     n_params: int,
@@ -157,8 +281,8 @@ chunked_wrapper_nb = vbt.chunked(
     # Execution
     # -> Processes:
     # execute_kwargs=dict(n_chunks="auto", distribute="chunks", engine="pathos"),
-    # -> Super-Chunks
-    execute_kwargs=dict(chunk_len="auto", engine="threadpool"),
+    # -> Super-Chunks (threads of the chunk level of `default_execution_policy`, see `ExecutionPolicy`)
+    execute_kwargs=default_execution_policy.execute_kwargs,
     # Each super chunk will consist of as many chunks as there are CPU cores - one per thread.
     # https://vectorbt.pro/pvt_1606a55a/cookbook/optimization/#hybrid-super-chunks
     # Any argument passed to the chunked decorator can be overridden
@@ -170,33 +294,422 @@ chunked_wrapper_nb = vbt.chunked(
 Source: https://vectorbt.pro/pvt_1606a55a/tutorials/superfast-supertrend/pipelines/#chunked-pipeline"""
 
 
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def chunked_banked_func_nb(
+    n_params: int,
+    close: tp.Array1d,
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike,
+    ann_factor: int
+) -> tp.Array1d:
+    """Backtest **multiple** strategies from precomputed indicator banks (same as `chunked_func_nb`).
+
+    The EMAs of all fast and slow periods, the RSIs of all time periods and the rolling
+    mean/std of all BBANDS windows of the chunk are computed once each (see `indicators.py`),
+    and every combination only selects its columns. The MACD signal line depends on the
+    (fast, slow) pair, so its bank over all signal periods is computed once per pair:
+    combinations are visited in (fast, slow) order, which keeps constrained and sampled
+    grids as cheap as the C-ordered product, and metrics are written back in input order."""
+    fastperiod_, slowperiod_, signalperiod_, timeperiod_, window_, alpha_ = get_param_arrays_nb(
+        fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+
+    # Indicator banks over the unique windows of the chunk
+    ema_windows = np.unique(np.concatenate((fastperiod_, slowperiod_)))
+    signal_windows = np.unique(signalperiod_)
+    rsi_windows = np.unique(timeperiod_)
+    bb_windows = np.unique(window_)
+    ema_bank = ewm_mean_bank_nb(close, ema_windows.astype(np.float64), ema_windows)
+    rsi_bank = rsi_bank_nb(close, rsi_windows)
+    bb_mean, bb_std = bbands_bank_nb(close, bb_windows)
+
+    # Visit combinations grouped by (fast, slow) pair (stable, so the C order is kept within a pair)
+    pair_keys = np.empty(n_params, dtype=np.int64)
+    for i in range(n_params):
+        fast_col = np.searchsorted(ema_windows, vbt.flex_select_1d_nb(fastperiod_, i))
+        slow_col = np.searchsorted(ema_windows, vbt.flex_select_1d_nb(slowperiod_, i))
+        pair_keys[i] = fast_col * ema_windows.shape[0] + slow_col
+    order = np.argsort(pair_keys, kind="mergesort")
+
+    metrics = np.empty(n_params, dtype=vbt.float_)
+    macd = np.empty(close.shape[0], dtype=vbt.float_)
+    signal_bank = np.empty((close.shape[0], signal_windows.shape[0]), dtype=vbt.float_)
+    last_pair = -1
+
+    for i in order:
+        if pair_keys[i] != last_pair:
+            fast_col, slow_col = pair_keys[i] // ema_windows.shape[0], pair_keys[i] % ema_windows.shape[0]
+            macd = ema_bank[:, fast_col] - ema_bank[:, slow_col]
+            signal_bank = ewm_mean_bank_nb(macd, signal_windows.astype(np.float64), signal_windows)
+            last_pair = pair_keys[i]
+        signal = signal_bank[:, np.searchsorted(signal_windows, vbt.flex_select_1d_nb(signalperiod_, i))]
+        rsi = rsi_bank[:, np.searchsorted(rsi_windows, vbt.flex_select_1d_nb(timeperiod_, i))]
+        bb_col = np.searchsorted(bb_windows, vbt.flex_select_1d_nb(window_, i))
+        bb_alpha = vbt.flex_select_1d_nb(alpha_, i)
+        upperband = bb_mean[:, bb_col] + bb_alpha * bb_std[:, bb_col]
+        lowerband = bb_mean[:, bb_col] - bb_alpha * bb_std[:, bb_col]
+
+        entries, exits = strategy_nb(close, macd, signal, rsi, upperband, lowerband)
+        sim_out = get_portfolio_nb(close, entries, exits)
+        metrics[i] = get_metrics_nb(sim_out, ann_factor)
+    return metrics
+
+
+# Split pipeline into chunks (each chunk builds the banks of its own windows)
+chunked_banked_wrapper_nb = make_chunked(chunked_banked_func_nb)
+"""Wrap `chunked_banked_func_nb` with the @chunked decorator (see `chunked_wrapper_nb`)."""
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def chunked_prefix_func_nb(
+    n_params: int,
+    close: tp.Array1d,
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike,
+    ann_factor: int
+) -> tp.Array1d:
+    """Backtest **multiple** strategies without simulation (same as `chunked_func_nb`).
+
+    Prefix sums are computed once per chunk, and each Sharpe ratio is assembled from the
+    trades of its signals (see `prefix_sharpe_nb`)."""
+    fastperiod_, slowperiod_, signalperiod_, timeperiod_, window_, alpha_ = get_param_arrays_nb(
+        fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+
+    cumsum, cumsum_sq = get_return_sums_nb(close)
+    metrics = np.empty(n_params, dtype=vbt.float_)
+
+    for i in range(n_params):
+        entries, exits = get_signals_nb(
+            close,
+            fastperiod=vbt.flex_select_1d_nb(fastperiod_, i),
+            slowperiod=vbt.flex_select_1d_nb(slowperiod_, i),
+            signalperiod=vbt.flex_select_1d_nb(signalperiod_, i),
+            timeperiod=vbt.flex_select_1d_nb(timeperiod_, i),
+            window=vbt.flex_select_1d_nb(window_, i),
+            alpha=vbt.flex_select_1d_nb(alpha_, i)
+        )
+        metrics[i] = prefix_sharpe_nb(entries, exits, cumsum, cumsum_sq, ann_factor)
+    return metrics
+
+
+# Split pipeline into chunks
+chunked_prefix_wrapper_nb = make_chunked(chunked_prefix_func_nb)
+"""Wrap `chunked_prefix_func_nb` with the @chunked decorator (see `chunked_wrapper_nb`)."""
+
+
+# Sharpe Stability Profile
+# ------------------------
+# A high full-period Sharpe ratio can come entirely from one regime. The stability build
+# of the pipeline reuses the returns of the simulation that produces the full-period Sharpe
+# ratio, builds their prefix sums in one pass, and derives the Sharpe ratio of every
+# sub-period from prefix-sum differences (O(1) per window). Sub-periods are given as
+# `(starts, ends)` bar ranges (see `get_stability_windows`): rolling windows or calendar
+# buckets. Each combination is reduced to a fixed-width record (see `STABILITY_FIELDS`)
+# instead of its returns.
+
+STABILITY_FIELDS = ("sharpe_ratio", "min_sharpe", "median_sharpe", "positive_frac")
+"""Fields of the stability record of a combination, in the order of the columns of `chunked_stability_func_nb`.
+
+`positive_frac` is the number of sub-periods with a positive Sharpe ratio divided by the number
+of **all** sub-periods, including degenerate ones (zero variance or fewer than 2 bars), while
+`min_sharpe` and `median_sharpe` only cover sub-periods with a defined Sharpe ratio."""
+
+
+def get_stability_windows(
+    index: tp.Union[int, pd.Index],
+    window: tp.Optional[int] = None,
+    step: tp.Optional[int] = None,
+    freq: tp.Optional[str] = None
+) -> tp.Tuple[tp.Array1d, tp.Array1d]:
+    """
+    Bar ranges `[starts, ends)` of the sub-periods of a stability profile.
+
+    Parameters
+    ----------
+    index : int | pd.Index
+        Number of bars (Python or NumPy integer), or the datetime index of `close` (required with `freq`).
+    window : int, optional
+        Length of rolling windows in bars.
+    step : int, optional
+        Step between rolling windows in bars, by default `window` (non-overlapping).
+    freq : str, optional
+        Calendar frequency of buckets (e.g. "Y", "Q", "M"), used instead of `window`.
+
+    Returns
+    -------
+    tp.Tuple[tp.Array1d, tp.Array1d]
+        Start (included) and end (excluded) bars of each sub-period.
+
+    Examples
+    --------
+    >>> starts, ends = get_stability_windows(len(close), window=252, step=21)
+    >>> starts, ends = get_stability_windows(data.index, freq="Y")
+    """
+    if freq is not None:
+        if not isinstance(index, pd.DatetimeIndex):
+            raise ValueError("Calendar buckets require a DatetimeIndex")
+        if index.tz is not None:
+            index = index.tz_localize(None)  # <- Periods are timezone-naive
+        codes = index.to_period(freq).asi8
+        starts = np.concatenate(([0], np.flatnonzero(codes[1:] != codes[:-1]) + 1))
+        ends = np.append(starts[1:], len(codes))
+        return starts.astype(np.int64), ends.astype(np.int64)
+    if window is None:
+        raise ValueError("Either window or freq must be provided")
+    n_bars = int(index) if isinstance(index, numbers.Integral) else len(index)
+    if window < 2 or window > n_bars:
+        raise ValueError(f"Invalid window: {window}, must be between 2 and the number of bars ({n_bars})")
+    starts = np.arange(0, n_bars - window + 1, step if step is not None else window, dtype=np.int64)
+    return starts, starts + window
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def stability_stats_nb(
+    returns: tp.Array1d,
+    starts: tp.Array1d,
+    ends: tp.Array1d,
+    ann_factor: int,
+    cumsum: tp.Array1d,
+    cumsum_sq: tp.Array1d,
+    window_sharpes: tp.Array1d
+) -> tp.Tuple[float, float, float]:
+    """Minimum, median and fraction of positive Sharpe ratios (ddof=1) over the sub-periods of `returns`.
+
+    `cumsum`, `cumsum_sq` (one more element than `returns`) and `window_sharpes` (one element
+    per sub-period) are reusable buffers. Degenerate sub-periods (zero variance, e.g. no trade,
+    or fewer than 2 bars) are excluded from the minimum and the median, but stay in the
+    denominator of the fraction of positive sub-periods."""
+    cumsum[0] = 0.0
+    cumsum_sq[0] = 0.0
+    for i in range(returns.shape[0]):
+        cumsum[i + 1] = cumsum[i] + returns[i]
+        cumsum_sq[i + 1] = cumsum_sq[i] + returns[i] ** 2
+
+    n_valid = 0
+    n_positive = 0
+    for w in range(starts.shape[0]):
+        n = ends[w] - starts[w]
+        if n < 2:
+            continue
+        mean = (cumsum[ends[w]] - cumsum[starts[w]]) / n
+        var = (cumsum_sq[ends[w]] - cumsum_sq[starts[w]] - n * mean ** 2) / (n - 1)
+        if var <= 0:
+            continue
+        sharpe = mean / np.sqrt(var) * np.sqrt(ann_factor)
+        window_sharpes[n_valid] = sharpe
+        n_valid += 1
+        if sharpe > 0:
+            n_positive += 1
+
+    if starts.shape[0] == 0:
+        return np.nan, np.nan, np.nan
+    if n_valid == 0:
+        return np.nan, np.nan, 0.0
+    valid = np.sort(window_sharpes[:n_valid])
+    if n_valid % 2 == 1:
+        median = valid[n_valid // 2]
+    else:
+        median = (valid[n_valid // 2 - 1] + valid[n_valid // 2]) / 2
+    return valid[0], median, n_positive / starts.shape[0]
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def chunked_stability_func_nb(
+    n_params: int,
+    close: tp.Array1d,
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike,
+    ann_factor: int,
+    starts: tp.Array1d,
+    ends: tp.Array1d
+) -> tp.Array2d:
+    """Backtest **multiple** strategies (same as `chunked_func_nb`) and return their stability
+    records of shape (n_params, len(STABILITY_FIELDS)) over the sub-periods `[starts, ends)`."""
+    fastperiod_, slowperiod_, signalperiod_, timeperiod_, window_, alpha_ = get_param_arrays_nb(
+        fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+
+    records = np.empty((n_params, len(STABILITY_FIELDS)), dtype=vbt.float_)
+    cumsum = np.empty(close.shape[0] + 1, dtype=vbt.float_)
+    cumsum_sq = np.empty(close.shape[0] + 1, dtype=vbt.float_)
+    window_sharpes = np.empty(starts.shape[0], dtype=vbt.float_)
+
+    for i in range(n_params):
+        entries, exits = get_signals_nb(
+            close,
+            fastperiod=vbt.flex_select_1d_nb(fastperiod_, i),
+            slowperiod=vbt.flex_select_1d_nb(slowperiod_, i),
+            signalperiod=vbt.flex_select_1d_nb(signalperiod_, i),
+            timeperiod=vbt.flex_select_1d_nb(timeperiod_, i),
+            window=vbt.flex_select_1d_nb(window_, i),
+            alpha=vbt.flex_select_1d_nb(alpha_, i)
+        )
+        sim_out = get_portfolio_nb(close, entries, exits)
+        records[i, 0] = get_metrics_nb(sim_out, ann_factor)
+        records[i, 1], records[i, 2], records[i, 3] = stability_stats_nb(
+            sim_out.in_outputs.returns[:, 0], starts, ends, ann_factor, cumsum, cumsum_sq, window_sharpes)
+    return records
+
+
+# Split pipeline into chunks (records of chunks are stacked row-wise)
+chunked_stability_wrapper_nb = make_chunked(chunked_stability_func_nb, whole_args=("starts", "ends"), merge_func="row_stack")
+"""Wrap `chunked_stability_func_nb` with the @chunked decorator (see `chunked_wrapper_nb`)."""
+
+
+def get_mode_path(path: str | Path, mode: tp.Optional[str] = None, key: tp.Any = None) -> Path:
+    """Cache file of the result of a mode of `pipeline_chunked_nb`.
+
+    The default mode (None) uses `path` as is, other modes use `<stem>.<mode><suffix>`. If `key`
+    is provided (e.g. the grid and the stability sub-periods), a short hash of its arrays is
+    appended to the stem (`<stem>.<mode>-<hash><suffix>`, or `<stem>.<hash><suffix>`)."""
+    path = Path(path)
+    tags = [] if mode is None else [mode]
+    if key is not None:
+        h = hashlib.sha256()
+        for arr in key:
+            arr = np.asarray(arr)
+            if arr.dtype == object:
+                h.update(repr(arr.tolist()).encode())
+            else:
+                h.update(arr.dtype.str.encode())
+                h.update(np.ascontiguousarray(arr).tobytes())
+            h.update(b"|")
+        tags.append(h.hexdigest()[:12])
+    if len(tags) == 0:
+        return path
+    return path.with_name(f"{path.stem}.{'-'.join(tags)}{path.suffix}")
+
+
 def pipeline_chunked_nb(
     close: tp.Array1d,
     params: tp.Dict[str, vbt.Param],
     ann_factor: int,
     path: tp.Optional[str | Path] = None,
     to_pd_series: tp.Optional[bool] = False,
+    constraints: tp.Optional[tp.Sequence[str]] = None,
+    n_samples: tp.Optional[int] = None,
+    sampling: str = "uniform",
+    seed: tp.Optional[int] = None,
+    to_sweep_result: tp.Optional[bool] = False,
+    banked: tp.Optional[bool] = False,
+    prefix_sharpe: tp.Optional[bool] = False,
+    stability: tp.Optional[tp.Tuple[tp.Array1d, tp.Array1d]] = None,
+    policy: tp.Optional[ExecutionPolicy] = None,
     **exe_kwargs
-) -> tp.Array1d | pd.Series:
+) -> tp.Array1d | tp.Array2d | pd.Series | pd.DataFrame | SweepResult:
     """Backtest **multiple** strategies into chunks.
 
+    If `constraints` are provided (e.g. `ParamTemplate.constraints`), degenerate combinations
+    are skipped before execution (see `build_grid`), and `n_bars` refers to the length of `close`.
+
+    If `n_samples` is provided, only a subset of combinations is drawn with `sampling`
+    ("uniform", "lhs" or "sobol") and `seed` directly in index space, without building
+    the full grid (see `sample_grid`).
+
+    If `params` contain stop axes (`StopTemplate`: `sl_stop`, `tp_stop`, `tsl_stop`), the
+    fast stop simulator is used instead (see `chunked_stops_wrapper_nb`).
+
+    If `to_sweep_result` is True, returns a compact `SweepResult` (metric array plus grid)
+    instead of a pandas Series with a MultiIndex.
+
+    If `banked` is True, indicators are precomputed per chunk for all windows at once
+    (see `chunked_banked_wrapper_nb`).
+
+    If `prefix_sharpe` is True, the Sharpe ratio is computed from the trades and prefix sums
+    of returns instead of a simulation (see `chunked_prefix_wrapper_nb`).
+
+    If `stability` sub-periods `(starts, ends)` are provided (see `get_stability_windows`),
+    returns a stability record per combination (see `STABILITY_FIELDS`) of shape (n_params, 4)
+    instead of the Sharpe ratio only, as a DataFrame with `to_pd_series`, and as one metric per
+    field with `to_sweep_result` (see `chunked_stability_wrapper_nb`).
+
+    Stop axes, `banked`, `prefix_sharpe` and `stability` select exclusive modes: combining
+    them raises ValueError. With `path`, the result of a mode other than the default one is
+    cached in its own file (`<stem>.<mode><suffix>`), and the file of a result restricted to
+    a grid (constraints, sampling or `to_sweep_result`) is keyed by a hash of the grid
+    (see `get_mode_path`).
+
+    The engine workers follow the chunk level of `policy` (`default_execution_policy` if None,
+    see `ExecutionPolicy`), `_execute_kwargs` still take precedence.
+
     Returns metric arraysepcify in `get_metric_nb`."""
-    # Construct the parameter grid manually
-    param_product, param_index = vbt.combine_params(params)
-    # Total number of parameter combinations
-    n_params = len(param_index)
+    with_stops = any(name in params for name in stop_param_names)
+    modes = dict(stops=with_stops, banked=banked, prefix=prefix_sharpe, stability=stability is not None)
+    selected = [mode for mode, enabled in modes.items() if enabled]
+    if len(selected) > 1:
+        raise ValueError(f"Incompatible modes: {selected}, select at most one")
+    mode = selected[0] if selected else None
+    if stability is not None:
+        starts, ends = (np.asarray(arr, dtype=np.int64) for arr in stability)
+
+    policy = policy if policy is not None else default_execution_policy
+    exe_kwargs = policy.chunked_kwargs(**exe_kwargs)
+    if n_samples is not None:
+        # Draw a subset of combinations in index space
+        grid = sample_grid(params, n_samples, method=sampling, seed=seed,
+                           constraints=constraints or (), n_bars=len(close))
+    elif constraints is not None or to_sweep_result:
+        # Construct the grid of valid combinations only
+        grid = build_grid(params, constraints or (), n_bars=len(close))
+    else:
+        grid = None
+    if grid is not None:
+        param_product, n_params = grid.param_product, grid.n_params
+    else:
+        # Construct the parameter grid manually
+        param_product, param_index = vbt.combine_params(params)
+        # Total number of parameter combinations
+        n_params = len(param_index)
+    if path is not None:
+        # Results of other grids or sub-periods are cached in other files
+        key = [np.array(grid.names), grid.index, *grid.values] if grid is not None else []
+        if mode == "stability":
+            key += [starts, ends]
+        path = get_mode_path(path, mode, key=key if len(key) > 0 else None)
     # Extract kwargs
     merged_kwargs = vbt.merge_dicts(
         param_product,
         dict(n_params=n_params, close=close, ann_factor=ann_factor, **exe_kwargs)
     )
+    if with_stops:
+        # Missing stop axes are disabled (flexible arrays of one element are broadcast)
+        for name in stop_param_names:
+            merged_kwargs.setdefault(name, np.array([np.nan]))
     if path is not None and vbt.file_exists(path):
         metrics = vbt.load(path)
     else:
         # Iterate over chunks and pass each subset to the parent function for execution
-        metrics = chunked_wrapper_nb(**merged_kwargs)
+        if mode == "stops":
+            metrics = chunked_stops_wrapper_nb(**merged_kwargs)
+        elif mode == "stability":
+            metrics = chunked_stability_wrapper_nb(starts=starts, ends=ends, **merged_kwargs)
+        elif mode == "prefix":
+            metrics = chunked_prefix_wrapper_nb(**merged_kwargs)
+        elif mode == "banked":
+            metrics = chunked_banked_wrapper_nb(**merged_kwargs)
+        else:
+            metrics = chunked_wrapper_nb(**merged_kwargs)
         # Save the result if path is provided
         if path is not None:
             vbt.save(metrics, path)
 
-    return pd.Series(metrics, index=param_index) if to_pd_series else metrics
+    if to_sweep_result:
+        if mode == "stability":
+            return SweepResult(metrics=dict(zip(STABILITY_FIELDS, metrics.T)), grid=grid)
+        return SweepResult(metrics=dict(sharpe_ratio=metrics), grid=grid)
+    if to_pd_series:
+        if mode == "stability":
+            return pd.DataFrame(metrics, index=grid.param_index if grid is not None else param_index,
+                                columns=list(STABILITY_FIELDS))
+        return pd.Series(metrics, index=grid.param_index if grid is not None else param_index)
+    return metrics
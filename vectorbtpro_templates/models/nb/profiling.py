@@ -0,0 +1,185 @@
+import time
+import ctypes
+import ctypes.util
+import pandas as pd
+import numpy as np
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import ExecutionPolicy, default_execution_policy
+from vectorbtpro_templates.models.nb.chunking import get_param_arrays_nb, make_chunked
+from vectorbtpro_templates.models.nb.strategies import strategy_nb
+from vectorbtpro_templates.models.nb.pipelines import get_portfolio_nb, get_metrics_nb
+
+__all__ = [
+    "PROFILE_STAGES",
+    "clock_ns_nb",
+    "pipeline_profiled_nb",
+    "chunked_profiled_func_nb",
+    "chunked_profiled_wrapper_nb",
+    "stats_to_frame",
+    "pipeline_profiled_chunked_nb",
+]
+
+
+# Per-Stage Profiling of the Numba Pipeline
+# -----------------------------------------
+# Python timers around compiled calls measure the call overhead rather than the stages.
+# The profiled pipeline below reads a monotonic clock from inside the compiled code
+# (`clock_gettime` through ctypes, POSIX only) and accumulates, per stage, the number of
+# calls, the elapsed nanoseconds and the bytes of the arrays returned by the stage into a
+# preallocated stats array of shape (stages, 3). Each chunk (thread) owns its stats array,
+# and stats are summed when chunks are merged. The regular pipeline (`pipeline_nb`,
+# `chunked_func_nb`) is left untouched, so that profiling costs nothing when not used.
+
+PROFILE_STAGES = ("macd", "rsi", "bbands", "strategy", "portfolio", "metrics")
+"""Stages of `pipeline_profiled_nb`, in the order of the rows of the stats array."""
+
+_N_STAGES = len(PROFILE_STAGES)
+
+try:
+    _libc = ctypes.CDLL(ctypes.util.find_library("c"))
+    _clock_gettime = _libc.clock_gettime
+    _clock_gettime.argtypes = [ctypes.c_int, ctypes.POINTER(ctypes.c_int64)]
+    _clock_gettime.restype = ctypes.c_int
+    _CLOCK_MONOTONIC = time.CLOCK_MONOTONIC
+except (OSError, AttributeError, TypeError):
+    _clock_gettime = None  # <- Not available (e.g. Windows): profiled functions fail to compile
+    _CLOCK_MONOTONIC = 1
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def clock_ns_nb(ts: tp.Array1d) -> int:
+    """Monotonic clock in nanoseconds, `ts` is a reusable int64 buffer of two elements (`timespec`)."""
+    _clock_gettime(_CLOCK_MONOTONIC, ts.ctypes)
+    return ts[0] * 1_000_000_000 + ts[1]
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def record_stage_nb(stats: tp.Array2d, stage: int, start_ns: int, end_ns: int, nbytes: int) -> None:
+    """Accumulate one call of a stage: count, elapsed nanoseconds and bytes returned."""
+    stats[stage, 0] += 1
+    stats[stage, 1] += end_ns - start_ns
+    stats[stage, 2] += nbytes
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def pipeline_profiled_nb(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float,
+    ann_factor: int,
+    stats: tp.Array2d,
+    ts: tp.Array1d
+) -> float:
+    """Backtest a **single** strategy (same as `pipeline_nb`) and accumulate per-stage stats into `stats`."""
+    t0 = clock_ns_nb(ts)
+    macd, signal = vbt.indicators.nb.macd_1d_nb(
+        close, fast_window=fastperiod, slow_window=slowperiod, signal_window=signalperiod)
+    t1 = clock_ns_nb(ts)
+    record_stage_nb(stats, 0, t0, t1, macd.nbytes + signal.nbytes)
+
+    rsi = vbt.indicators.nb.rsi_1d_nb(close, window=timeperiod)
+    t2 = clock_ns_nb(ts)
+    record_stage_nb(stats, 1, t1, t2, rsi.nbytes)
+
+    upperband, middleband, lowerband = vbt.indicators.nb.bbands_1d_nb(close, window=window, alpha=alpha)
+    t3 = clock_ns_nb(ts)
+    record_stage_nb(stats, 2, t2, t3, upperband.nbytes + middleband.nbytes + lowerband.nbytes)
+
+    entries, exits = strategy_nb(close, macd, signal, rsi, upperband, lowerband)
+    t4 = clock_ns_nb(ts)
+    record_stage_nb(stats, 3, t3, t4, entries.nbytes + exits.nbytes)
+
+    sim_out = get_portfolio_nb(close, entries, exits)
+    t5 = clock_ns_nb(ts)
+    record_stage_nb(stats, 4, t4, t5, sim_out.order_records.nbytes + sim_out.in_outputs.returns.nbytes)
+
+    metric = get_metrics_nb(sim_out, ann_factor)
+    t6 = clock_ns_nb(ts)
+    record_stage_nb(stats, 5, t5, t6, 0)
+    return metric
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def chunked_profiled_func_nb(
+    n_params: int,
+    close: tp.Array1d,
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike,
+    ann_factor: int
+) -> tp.Tuple[tp.Array1d, tp.Array2d]:
+    """Backtest **multiple** strategies (same as `chunked_func_nb`) and return their metrics
+    with the stats of the chunk (see `PROFILE_STAGES`)."""
+    fastperiod_, slowperiod_, signalperiod_, timeperiod_, window_, alpha_ = get_param_arrays_nb(
+        fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+
+    metrics = np.empty(n_params, dtype=vbt.float_)
+    stats = np.zeros((_N_STAGES, 3), dtype=np.int64)
+    ts = np.empty(2, dtype=np.int64)
+
+    for i in range(n_params):
+        metrics[i] = pipeline_profiled_nb(
+            close,
+            fastperiod=vbt.flex_select_1d_nb(fastperiod_, i),
+            slowperiod=vbt.flex_select_1d_nb(slowperiod_, i),
+            signalperiod=vbt.flex_select_1d_nb(signalperiod_, i),
+            timeperiod=vbt.flex_select_1d_nb(timeperiod_, i),
+            window=vbt.flex_select_1d_nb(window_, i),
+            alpha=vbt.flex_select_1d_nb(alpha_, i),
+            ann_factor=ann_factor,
+            stats=stats,
+            ts=ts
+        )
+    return metrics, stats
+
+
+def merge_profiled(results: tp.List[tp.Tuple[tp.Array1d, tp.Array2d]], **kwargs) -> tp.Tuple[tp.Array1d, tp.Array2d]:
+    """Concatenate the metrics and sum the stats of all chunks."""
+    return np.concatenate([r[0] for r in results]), np.sum([r[1] for r in results], axis=0)
+
+
+# Split pipeline into chunks
+chunked_profiled_wrapper_nb = make_chunked(chunked_profiled_func_nb, merge_func=merge_profiled)
+"""Wrap `chunked_profiled_func_nb` with the @chunked decorator (see `chunked_wrapper_nb`)."""
+
+
+def stats_to_frame(stats: tp.Array2d) -> pd.DataFrame:
+    """Stage breakdown of a stats array: calls, total and per-call time, share of time and bytes."""
+    df = pd.DataFrame(stats, index=pd.Index(PROFILE_STAGES, name="stage"), columns=["count", "time_ns", "bytes"])
+    df["ns_per_call"] = df["time_ns"] / df["count"]
+    df["time_share"] = df["time_ns"] / df["time_ns"].sum()
+    return df
+
+
+def pipeline_profiled_chunked_nb(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    ann_factor: int,
+    policy: tp.Optional[ExecutionPolicy] = None,
+    **exe_kwargs
+) -> tp.Tuple[tp.Array1d, pd.DataFrame]:
+    """Backtest **multiple** strategies into chunks (same as `pipeline_chunked_nb`) with per-stage profiling.
+
+    Returns the metric array and the stage breakdown of the whole sweep (see `stats_to_frame`).
+    Times are summed over threads, so that shares are comparable whatever the parallelism."""
+    policy = policy if policy is not None else default_execution_policy
+    exe_kwargs = policy.chunked_kwargs(**exe_kwargs)
+    param_product, param_index = vbt.combine_params(params)
+    metrics, stats = chunked_profiled_wrapper_nb(
+        n_params=len(param_index),
+        close=close,
+        ann_factor=ann_factor,
+        **param_product,
+        **exe_kwargs
+    )
+    return metrics, stats_to_frame(stats)
@@ -0,0 +1,190 @@
+import time
+import numpy as np
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import ExecutionPolicy, default_execution_policy
+from vectorbtpro_templates.grid import build_grid
+from vectorbtpro_templates.models.nb.pipelines import chunked_wrapper_nb
+
+__all__ = ["HalvingResult", "pipeline_halving_nb"]
+
+
+# Successive-Halving Grid Search
+# ------------------------------
+# Exhaustive sweeps spend the same full-history cost on every combination, even
+# though most of them are clearly bad after a fraction of the data. Successive halving
+# evaluates all combinations on a cheap, low-fidelity version of the history (short
+# recent window or subsampled bars), keeps the top `1 / reduction_factor` fraction,
+# and re-evaluates the survivors on longer histories until the full history is reached.
+# https://arxiv.org/abs/1502.07943
+
+
+class HalvingResult(tp.NamedTuple):
+    """Result of `pipeline_halving_nb`."""
+    params: tp.Dict[str, tp.Array1d]
+    """Parameter values of the final survivors, sorted by metric (best first)."""
+    metrics: tp.Array1d
+    """Full-history metric of the final survivors."""
+    grid_index: tp.Array1d
+    """Position of the final survivors in the (constrained) parameter grid."""
+    n_evaluated: tp.List[int]
+    """Number of combinations evaluated at each rung."""
+    n_bars: tp.List[int]
+    """Number of bars used at each rung."""
+    elapsed: float
+    """Wall time of the successive-halving search (seconds)."""
+    exhaustive_elapsed: tp.Optional[float] = None
+    """Wall time of the exhaustive search (seconds), if compared."""
+    top_k_overlap: tp.Optional[float] = None
+    """Fraction of the exhaustive top-K recovered by the final survivors, if compared."""
+
+    @property
+    def time_saved(self) -> tp.Optional[float]:
+        """Wall time saved compared with the exhaustive search (seconds), if compared."""
+        if self.exhaustive_elapsed is None:
+            return None
+        return self.exhaustive_elapsed - self.elapsed
+
+
+def _rank_desc(metrics: tp.Array1d) -> tp.Array1d:
+    """Positions sorting `metrics` in descending order, NaN last."""
+    return np.argsort(np.where(np.isnan(metrics), -np.inf, metrics), kind="stable")[::-1]
+
+
+def _run_chunked(
+    close: tp.Array1d,
+    param_product: tp.Dict[str, tp.Array1d],
+    select: tp.Array1d,
+    ann_factor: int,
+    **exe_kwargs
+) -> tp.Array1d:
+    """Run `chunked_wrapper_nb` on the selected parameter combinations."""
+    return chunked_wrapper_nb(
+        n_params=len(select),
+        close=close,
+        ann_factor=ann_factor,
+        **{name: values[select] for name, values in param_product.items()},
+        **exe_kwargs
+    )
+
+
+def pipeline_halving_nb(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    ann_factor: int,
+    reduction_factor: int = 3,
+    n_rungs: int = 3,
+    fidelity: str = "recent",
+    constraints: tp.Optional[tp.Sequence[str]] = None,
+    compare: bool = False,
+    top_k: tp.Optional[int] = None,
+    policy: tp.Optional[ExecutionPolicy] = None,
+    **exe_kwargs
+) -> HalvingResult:
+    """
+    Backtest **multiple** strategies with successive halving over the chunked pipeline.
+
+    At rung `r` (0-based), the history is reduced by `reduction_factor ** (n_rungs - 1 - r)`,
+    and only the top `1 / reduction_factor` fraction of combinations is promoted to the
+    next rung. The last rung runs on the full history.
+
+    Parameters
+    ----------
+    close : tp.Array1d
+        Close prices.
+    params : tp.Dict[str, vbt.Param]
+        Parameter values by name.
+    ann_factor : int
+        Annualization factor.
+    reduction_factor : int, optional
+        History reduction and survivor selection factor between rungs, by default 3.
+    n_rungs : int, optional
+        Number of rungs (including the full-history one), by default 3.
+    fidelity : str, optional
+        How the history is reduced: "recent" (most recent bars only) or "subsample"
+        (every n-th bar, annualization factor adjusted accordingly), by default "recent".
+    constraints : tp.Sequence[str], optional
+        Constraints skipping degenerate combinations (see `build_grid`), by default None.
+    compare : bool, optional
+        If True, also runs the exhaustive search to report wall time saved and
+        top-K overlap (the kernel is compiled before both timed runs), by default False.
+    top_k : int, optional
+        Size of the top-K used for the overlap, by default the number of final survivors.
+    policy : ExecutionPolicy, optional
+        Split of the core budget across layers of parallelism, by default `default_execution_policy`.
+    **exe_kwargs
+        Keyword arguments passed to `chunked_wrapper_nb` (e.g. `_execute_kwargs`).
+
+    Returns
+    -------
+    HalvingResult
+        Final survivors, their full-history metrics and the search report.
+
+    Examples
+    --------
+    >>> result = pipeline_halving_nb(close, default_vbt_params, ann_factor, reduction_factor=3, n_rungs=3, compare=True)
+    >>> result.time_saved, result.top_k_overlap
+    """
+    if reduction_factor < 2:
+        raise ValueError("reduction_factor must be at least 2")
+    if n_rungs < 1:
+        raise ValueError("n_rungs must be at least 1")
+    if fidelity not in ("recent", "subsample"):
+        raise ValueError(f"Invalid fidelity: '{fidelity}'")
+    policy = policy if policy is not None else default_execution_policy
+    exe_kwargs = policy.chunked_kwargs(**exe_kwargs)
+    grid = build_grid(params, constraints or (), n_bars=len(close))
+    param_product = grid.param_product
+    if compare and grid.n_params > 0:
+        # Compile the kernel outside of both timed regions
+        _run_chunked(close=close, param_product=param_product, select=np.arange(1),
+                     ann_factor=ann_factor, **exe_kwargs)
+
+    start = time.perf_counter()
+    survivors = np.arange(grid.n_params)
+    n_evaluated = []
+    n_bars = []
+    for rung in range(n_rungs):
+        step = reduction_factor ** (n_rungs - 1 - rung)
+        if fidelity == "recent":
+            rung_close = close[-max(len(close) // step, 1):]
+        else:
+            rung_close = close[::-1][::step][::-1].copy()  # <- Always keep the last bar
+        metrics = _run_chunked(close=rung_close, param_product=param_product, select=survivors,
+                               ann_factor=ann_factor, **exe_kwargs)
+        if fidelity == "subsample":
+            # Annualize over `ann_factor / step` bars by rescaling the Sharpe ratios, so that
+            # `ann_factor` keeps its type across rungs (no recompilation of the kernel)
+            metrics = metrics / np.sqrt(step)
+        n_evaluated.append(len(survivors))
+        n_bars.append(len(rung_close))
+        ranking = _rank_desc(metrics)
+        if rung < n_rungs - 1:
+            n_keep = max(len(survivors) // reduction_factor, 1)
+            survivors = np.sort(survivors[ranking[:n_keep]])
+    survivors = survivors[ranking]
+    metrics = metrics[ranking]
+    elapsed = time.perf_counter() - start
+
+    exhaustive_elapsed = None
+    top_k_overlap = None
+    if compare:
+        start = time.perf_counter()
+        all_metrics = _run_chunked(close=close, param_product=param_product, select=np.arange(grid.n_params),
+                                   ann_factor=ann_factor, **exe_kwargs)
+        exhaustive_elapsed = time.perf_counter() - start
+        k = min(top_k or len(survivors), len(survivors))
+        top_exhaustive = _rank_desc(all_metrics)[:k]
+        top_k_overlap = len(np.intersect1d(top_exhaustive, survivors[:k])) / k
+
+    return HalvingResult(
+        params={name: values[survivors] for name, values in param_product.items()},
+        metrics=metrics,
+        grid_index=survivors,
+        n_evaluated=n_evaluated,
+        n_bars=n_bars,
+        elapsed=elapsed,
+        exhaustive_elapsed=exhaustive_elapsed,
+        top_k_overlap=top_k_overlap
+    )
@@ -0,0 +1,363 @@
+import os
+import time
+import hashlib
+import socket
+import sqlite3
+import threading
+import multiprocessing
+from contextlib import closing
+from pathlib import Path
+import numpy as np
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import ExecutionPolicy, default_execution_policy
+from vectorbtpro_templates.grid import ParamGrid, build_grid, _get_axes
+from vectorbtpro_templates.models.nb.pipelines import chunked_wrapper_nb
+
+__all__ = [
+    "ShardCoordinator",
+    "sweep_fingerprint",
+    "run_shard_worker",
+    "merge_shards",
+    "pipeline_sharded_nb",
+]
+
+
+# Sharded Sweep Execution
+# -----------------------
+# A single `pipeline_chunked_nb` call can only use one machine. The flat combination
+# index range is split deterministically into shards, which independent worker processes
+# (on this host or on others sharing a filesystem) claim from a SQLite-backed queue,
+# run through `chunked_wrapper_nb` and write to disk. Workers refresh a heartbeat while
+# running a shard: shards of dead peers become stale after `lease_timeout` seconds and
+# are claimed again, so that workers without a shard to claim keep polling until the sweep
+# is done. A merge step assembles the final metric array. The coordinator stores a
+# fingerprint of the sweep (close, parameters, annualization factor, constraints, number of
+# combinations and shard length), and refuses to resume a directory created for another sweep.
+# Note: SQLite relies on file locks, which must be supported by the shared filesystem.
+
+
+class ShardCoordinator:
+    """SQLite-backed queue of shards stored in `path / "coordinator.sqlite"`.
+
+    Shard `i` covers the combinations `[i * shard_len, min((i + 1) * shard_len, n_params))`
+    of the flat index range, its result is stored in `path / "shard_{i}.npy"`."""
+
+    def __init__(self, path: str | Path, lease_timeout: float = 600.0) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.path / "coordinator.sqlite"
+        self.lease_timeout = lease_timeout
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS shards ("
+                "id INTEGER PRIMARY KEY, start INTEGER, stop INTEGER, "
+                "status TEXT DEFAULT 'pending', worker TEXT, heartbeat REAL, attempts INTEGER DEFAULT 0)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new connection (one per operation, safe across threads and processes)."""
+        return sqlite3.connect(self.db_path, timeout=60.0, isolation_level=None)
+
+    def shard_path(self, shard_id: int) -> Path:
+        """Path of the result file of a shard."""
+        return self.path / f"shard_{shard_id:06d}.npy"
+
+    def create(self, n_params: int, shard_len: int, fingerprint: str = "") -> int:
+        """Split `n_params` combinations into shards of `shard_len` (idempotent). Returns the number of shards.
+
+        Raises ValueError if the directory holds shards of another sweep (different `fingerprint`,
+        `n_params` or `shard_len`)."""
+        n_shards = -(-n_params // shard_len)
+        meta = dict(fingerprint=fingerprint, n_params=str(n_params), shard_len=str(shard_len))
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            stored = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if not stored and conn.execute("SELECT COUNT(*) FROM shards").fetchone()[0] > 0:
+                conn.execute("ROLLBACK")
+                raise ValueError(f"Directory {self.path} holds shards of an unknown sweep")
+            if stored and stored != meta:
+                conn.execute("ROLLBACK")
+                raise ValueError(f"Directory {self.path} holds shards of another sweep: {stored} != {meta}")
+            conn.executemany("INSERT OR IGNORE INTO meta (key, value) VALUES (?, ?)", list(meta.items()))
+            conn.executemany(
+                "INSERT OR IGNORE INTO shards (id, start, stop) VALUES (?, ?, ?)",
+                [(i, i * shard_len, min((i + 1) * shard_len, n_params)) for i in range(n_shards)]
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return n_shards
+
+    def validate(self, fingerprint: str) -> None:
+        """Raise ValueError if the coordinator was created for a sweep with another fingerprint."""
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        if row is not None and row[0] != fingerprint:
+            raise ValueError(f"Directory {self.path} holds shards of another sweep")
+
+    def claim(self, worker: str) -> tp.Optional[tp.Tuple[int, int, int]]:
+        """Claim a pending or stale shard. Returns `(shard_id, start, stop)` or None if there is none."""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")  # <- Write lock: one claimer at a time
+            now = time.time()
+            row = conn.execute(
+                "SELECT id, start, stop FROM shards "
+                "WHERE status = 'pending' OR (status = 'running' AND heartbeat < ?) "
+                "ORDER BY id LIMIT 1",
+                (now - self.lease_timeout,)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE shards SET status = 'running', worker = ?, heartbeat = ?, attempts = attempts + 1 "
+                    "WHERE id = ?",
+                    (worker, now, row[0])
+                )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return row
+
+    def heartbeat(self, shard_id: int, worker: str) -> None:
+        """Refresh the lease of a running shard."""
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE shards SET heartbeat = ? WHERE id = ? AND worker = ? AND status = 'running'",
+                (time.time(), shard_id, worker)
+            )
+
+    def complete(self, shard_id: int) -> None:
+        """Mark a shard as done (its result file must already exist)."""
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE shards SET status = 'done' WHERE id = ?", (shard_id,))
+
+    def shard_ids(self) -> tp.List[int]:
+        """Identifiers of all shards, in index order."""
+        with closing(self._connect()) as conn:
+            return [row[0] for row in conn.execute("SELECT id FROM shards ORDER BY id")]
+
+    def progress(self) -> tp.Dict[str, int]:
+        """Number of shards by status."""
+        with closing(self._connect()) as conn:
+            return dict(conn.execute("SELECT status, COUNT(*) FROM shards GROUP BY status").fetchall())
+
+    def is_done(self) -> bool:
+        """Whether all shards are done."""
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM shards WHERE status != 'done'").fetchone()[0] == 0
+
+
+def sweep_fingerprint(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    ann_factor: int,
+    constraints: tp.Optional[tp.Sequence[str]] = None
+) -> str:
+    """Hash of the inputs defining the combinations and metrics of a sweep."""
+    arr = np.ascontiguousarray(np.asarray(close))
+    names, values = _get_axes(params)
+    h = hashlib.sha256()
+    h.update(repr((arr.dtype.str, arr.shape, names, [v.tolist() for v in values], ann_factor, constraints)).encode())
+    h.update(arr.tobytes())
+    return h.hexdigest()
+
+
+def _get_sweep_grid(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    constraints: tp.Optional[tp.Sequence[str]] = None
+) -> tp.Tuple[ParamGrid, int]:
+    """Grid of a sharded sweep and its number of combinations.
+
+    Without constraints, the flat index range is the full product and is never materialized."""
+    if constraints is not None:
+        grid = build_grid(params, constraints, n_bars=len(close))
+        return grid, grid.n_params
+    names, values = _get_axes(params)
+    return ParamGrid(names=names, values=values, index=None), int(np.prod([len(v) for v in values]))
+
+
+def run_shard_worker(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    ann_factor: int,
+    path: str | Path,
+    constraints: tp.Optional[tp.Sequence[str]] = None,
+    lease_timeout: float = 600.0,
+    worker: tp.Optional[str] = None,
+    poll_interval: tp.Optional[float] = None,
+    policy: tp.Optional[ExecutionPolicy] = None,
+    **exe_kwargs
+) -> int:
+    """
+    Claim shards from the coordinator in `path` and run them until the sweep is done.
+
+    Every worker of a sweep must be given the same `close`, `params` and `constraints`
+    (checked against the fingerprint of the coordinator). While other workers hold the
+    remaining shards, the worker polls every `poll_interval` seconds, so that it claims
+    the shards of dead peers once their lease is stale.
+
+    Parameters
+    ----------
+    close : tp.Array1d
+        Close prices.
+    params : tp.Dict[str, vbt.Param]
+        Parameter values by name.
+    ann_factor : int
+        Annualization factor.
+    path : str | Path
+        Shared directory of the coordinator and shard results.
+    constraints : tp.Sequence[str], optional
+        Constraints skipping degenerate combinations (see `build_grid`), by default None.
+    lease_timeout : float, optional
+        Seconds without heartbeat after which a running shard is considered stale,
+        by default 600.
+    worker : str, optional
+        Worker identifier, by default "<hostname>:<pid>".
+    poll_interval : float, optional
+        Seconds between claims while all remaining shards are running under peers,
+        by default `lease_timeout / 3` (at most 5 seconds).
+    policy : ExecutionPolicy, optional
+        Split of the core budget of this worker (`chunk_workers` threads per shard),
+        by default `default_execution_policy`.
+    **exe_kwargs
+        Keyword arguments passed to `chunked_wrapper_nb` (e.g. `_execute_kwargs`).
+
+    Returns
+    -------
+    int
+        Number of shards run by this worker.
+    """
+    coordinator = ShardCoordinator(path, lease_timeout=lease_timeout)
+    worker = worker or f"{socket.gethostname()}:{os.getpid()}"
+    policy = policy if policy is not None else default_execution_policy
+    exe_kwargs = policy.chunked_kwargs(**exe_kwargs)
+    coordinator.validate(sweep_fingerprint(close, params, ann_factor, constraints))
+    if poll_interval is None:
+        poll_interval = min(lease_timeout / 3, 5.0)
+    grid, _ = _get_sweep_grid(close, params, constraints)
+    n_run = 0
+
+    while True:
+        shard = coordinator.claim(worker)
+        if shard is None:
+            if coordinator.is_done():
+                break
+            # Remaining shards are running under peers, wait for them to finish or go stale
+            time.sleep(poll_interval)
+            continue
+        shard_id, start, stop = shard
+        index = np.arange(start, stop) if grid.index is None else grid.index[start:stop]
+        param_product = grid._replace(index=index).param_product
+
+        # Keep the lease alive while the shard is running
+        stop_event = threading.Event()
+
+        def _heartbeat() -> None:
+            while not stop_event.wait(lease_timeout / 3):
+                coordinator.heartbeat(shard_id, worker)
+
+        thread = threading.Thread(target=_heartbeat, daemon=True)
+        thread.start()
+        try:
+            metrics = chunked_wrapper_nb(
+                n_params=len(index),
+                close=close,
+                ann_factor=ann_factor,
+                **param_product,
+                **exe_kwargs
+            )
+        finally:
+            stop_event.set()
+            thread.join()
+
+        # Write atomically: a reclaimed shard may be written twice, with the same result
+        tmp_path = coordinator.shard_path(shard_id).with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            np.save(f, metrics)
+        os.replace(tmp_path, coordinator.shard_path(shard_id))
+        coordinator.complete(shard_id)
+        n_run += 1
+    return n_run
+
+
+def merge_shards(path: str | Path) -> tp.Array1d:
+    """Assemble the metric array of a sharded sweep from its shard results.
+
+    Raises FileNotFoundError if `path` holds no sweep, and ValueError if it has no shards
+    or some shards are not done."""
+    if not (Path(path) / "coordinator.sqlite").exists():
+        raise FileNotFoundError(f"Directory {path} holds no sharded sweep")
+    coordinator = ShardCoordinator(path)
+    shard_ids = coordinator.shard_ids()
+    if len(shard_ids) == 0:
+        raise ValueError(f"Directory {path} holds no shards")
+    if not coordinator.is_done():
+        raise ValueError(f"Sweep is not complete: {coordinator.progress()}")
+    return np.concatenate([np.load(coordinator.shard_path(i)) for i in shard_ids])
+
+
+def pipeline_sharded_nb(
+    close: tp.Array1d,
+    params: tp.Dict[str, vbt.Param],
+    ann_factor: int,
+    path: str | Path,
+    n_workers: tp.Optional[int] = None,
+    shard_len: int = 100_000,
+    constraints: tp.Optional[tp.Sequence[str]] = None,
+    lease_timeout: float = 600.0,
+    policy: tp.Optional[ExecutionPolicy] = None,
+    **exe_kwargs
+) -> tp.Array1d:
+    """
+    Backtest **multiple** strategies by shards with `n_workers` local worker processes.
+
+    Workers on other hosts can join the same sweep by calling `run_shard_worker` with the
+    same arguments and a `path` on a shared filesystem. Re-running resumes an interrupted sweep,
+    a `path` holding another sweep raises ValueError. Raises RuntimeError if a local worker fails.
+
+    Worker processes are the trial level of `policy`: by default, `n_workers` is `policy.trial_jobs`,
+    and each worker runs shards with `policy.chunk_workers` threads. Without policy, `n_workers`
+    (2 by default) local workers share the cores of `default_execution_policy`.
+
+    Examples
+    --------
+    >>> sharpes = pipeline_sharded_nb(close, default_vbt_params, ann_factor, path="temp/sweep", n_workers=4)
+    >>> policy = ExecutionPolicy(trial_jobs=4)  # <- 4 processes sharing the remaining cores
+    >>> sharpes = pipeline_sharded_nb(close, default_vbt_params, ann_factor, path="temp/sweep", policy=policy)
+    """
+    if policy is None:
+        # Local workers share the cores of the default policy (at least one core each)
+        n_workers = n_workers or 2
+        n_cores = max(n_workers, default_execution_policy.resolve().n_cores)
+        policy = default_execution_policy._replace(n_cores=n_cores, trial_jobs=n_workers)
+    if n_workers is None:
+        n_workers = policy.resolve().trial_jobs
+    _, n_params = _get_sweep_grid(close, params, constraints)
+    coordinator = ShardCoordinator(path, lease_timeout=lease_timeout)
+    coordinator.create(n_params, shard_len, fingerprint=sweep_fingerprint(close, params, ann_factor, constraints))
+
+    kwargs = dict(
+        close=close,
+        params=params,
+        ann_factor=ann_factor,
+        path=path,
+        constraints=constraints,
+        lease_timeout=lease_timeout,
+        policy=policy,
+        **exe_kwargs
+    )
+    ctx = multiprocessing.get_context("spawn")
+    processes = [ctx.Process(target=run_shard_worker, kwargs=kwargs) for _ in range(n_workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    failed = [process.exitcode for process in processes if process.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {n_workers} shard workers failed (exit codes {failed})")
+    return merge_shards(path)
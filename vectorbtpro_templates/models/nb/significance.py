@@ -0,0 +1,288 @@
+import math
+from statistics import NormalDist
+import numpy as np
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import ExecutionPolicy, param_names, stop_param_names
+from vectorbtpro_templates.results import SweepResult
+from vectorbtpro_templates.models.nb.strategies import get_signals_nb
+from vectorbtpro_templates.models.nb.pipelines import get_portfolio_nb
+from vectorbtpro_templates.models.nb.stops import simulate_stops_nb
+
+__all__ = [
+    "SignificanceResult",
+    "get_returns_nb",
+    "get_sweep_returns",
+    "bootstrap_sharpe_nb",
+    "deflated_sharpe_ratio",
+    "pipeline_significance_nb",
+]
+
+
+# Significance of Sweep Winners
+# -----------------------------
+# The best Sharpe ratio of a sweep over many combinations is inflated by multiple testing.
+# The sweep only keeps metrics, so the top-K combinations are simulated again with the
+# simulator of the sweep (`get_portfolio_nb`, or `simulate_stops_nb` when the grid has stop
+# axes) to get their returns, and two checks are run on them:
+# - A stationary (random block lengths, Politis & Romano) or moving-block bootstrap of the
+#   returns, run as a parallel Numba kernel over (combination x resample). Each task draws
+#   from its own counter-based random stream, so that results do not depend on threads.
+#   Resamples of the returns give confidence intervals, resamples of the returns centered
+#   to a zero mean give the distribution of the Sharpe ratio under the null (no edge).
+# - The deflated Sharpe ratio (Bailey & Lopez de Prado), which compares each Sharpe ratio
+#   to the expected maximum of the sweep's own metric distribution, adjusted for the number
+#   of trials, the length of the returns and their skewness and kurtosis.
+
+
+class SignificanceResult(tp.NamedTuple):
+    """Significance of the top-K combinations of a sweep (best first)."""
+    params: tp.Dict[str, tp.Array1d]
+    sharpe: tp.Array1d  # <- Annualized Sharpe ratio of each combination
+    boot_sharpes: tp.Array2d  # <- Bootstrapped Sharpe ratios, shape (n_resamples, k)
+    p_value: tp.Array1d  # <- Fraction of null resamples (centered returns) with a Sharpe ratio >= `sharpe`
+    prob_nonpositive: tp.Array1d  # <- Fraction of resamples with a Sharpe ratio <= 0 (or undefined)
+    ci_lower: tp.Array1d
+    ci_upper: tp.Array1d
+    deflated_sharpe: tp.Array1d  # <- Probability that the true Sharpe ratio exceeds `expected_max_sharpe`
+    expected_max_sharpe: float  # <- Annualized expected maximum Sharpe ratio under the null
+    n_trials: int
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_returns_nb(
+    close: tp.Array1d,
+    fastperiod: tp.Array1d,
+    slowperiod: tp.Array1d,
+    signalperiod: tp.Array1d,
+    timeperiod: tp.Array1d,
+    window: tp.Array1d,
+    alpha: tp.Array1d,
+    sl_stop: tp.Array1d,
+    tp_stop: tp.Array1d,
+    tsl_stop: tp.Array1d,
+    with_stops: bool
+) -> tp.Array2d:
+    """Returns of **multiple** strategies (one column per combination), as simulated by
+    `simulate_stops_nb` if `with_stops` (same as `chunked_stops_func_nb`), by `get_portfolio_nb` otherwise."""
+    returns = np.empty((close.shape[0], fastperiod.shape[0]), dtype=vbt.float_)
+    for col in range(fastperiod.shape[0]):
+        entries, exits = get_signals_nb(
+            close, fastperiod[col], slowperiod[col], signalperiod[col], timeperiod[col], window[col], alpha[col])
+        if with_stops:
+            returns[:, col] = simulate_stops_nb(close, entries, exits, sl_stop[col], tp_stop[col], tsl_stop[col])
+        else:
+            sim_out = get_portfolio_nb(close, entries, exits)
+            returns[:, col] = sim_out.in_outputs.returns[:, 0]
+    return returns
+
+
+def get_sweep_returns(close: tp.Array1d, params: tp.Dict[str, tp.Array1d]) -> tp.Array2d:
+    """Returns of the combinations `params` (e.g. `SweepResult.params`) with the simulator of their sweep.
+
+    Stop axes (`StopTemplate`) select the stop simulator, missing stop axes are disabled."""
+    n_params = len(params[param_names[0]])
+    with_stops = any(name in params for name in stop_param_names)
+    stops = [
+        np.asarray(params[name], dtype=vbt.float_) if name in params else np.full(n_params, np.nan)
+        for name in stop_param_names
+    ]
+    return get_returns_nb(
+        np.asarray(close, dtype=vbt.float_),
+        *(np.asarray(params[name]) for name in param_names),
+        *stops,
+        with_stops
+    )
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def _uniform_nb(state: np.uint64) -> tp.Tuple[np.uint64, float]:
+    """Advance a SplitMix64 state and return a uniform float in [0, 1)."""
+    state = state + np.uint64(0x9E3779B97F4A7C15)
+    z = state
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return state, (z >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+
+@nb.njit(nogil=True, parallel=True)  # <- parallel over (combination x resample)
+def bootstrap_sharpe_nb(
+    returns: tp.Array2d,
+    n_resamples: int,
+    block_len: float,
+    stationary: bool,
+    ann_factor: int,
+    seed: int
+) -> tp.Array2d:
+    """Sharpe ratios (ddof=1, same as `get_metrics_nb`) of bootstrap resamples of each column of `returns`.
+
+    Resamples are built from circular blocks: of geometric length with mean `block_len`
+    if `stationary`, of fixed length `block_len` otherwise. Returns shape (n_resamples, n_columns)."""
+    n, n_cols = returns.shape
+    out = np.empty((n_resamples, n_cols), dtype=vbt.float_)
+    p_new_block = 1.0 / block_len
+    fixed_len = max(1, int(block_len))
+
+    for task in nb.prange(n_resamples * n_cols):
+        b = task // n_cols
+        col = task % n_cols
+        state = np.uint64(seed) + np.uint64(task) * np.uint64(0xD1B54A32D192ED03)
+        state, u = _uniform_nb(state)
+        i = int(u * n)
+        total = 0.0
+        total_sq = 0.0
+        for t in range(n):
+            if t > 0:
+                if stationary:
+                    state, u = _uniform_nb(state)
+                    new_block = u < p_new_block
+                else:
+                    new_block = t % fixed_len == 0
+                if new_block:
+                    state, u = _uniform_nb(state)
+                    i = int(u * n)
+                else:
+                    i = i + 1 if i + 1 < n else 0
+            ret = returns[i, col]
+            total += ret
+            total_sq += ret * ret
+        mean = total / n
+        var = (total_sq - n * mean * mean) / (n - 1)
+        out[b, col] = mean / np.sqrt(var) * np.sqrt(ann_factor) if var > 0 else np.nan
+    return out
+
+
+def deflated_sharpe_ratio(
+    sharpe: tp.Array1d,
+    returns: tp.Array2d,
+    trial_sharpes: tp.Array1d,
+    ann_factor: int
+) -> tp.Tuple[tp.Array1d, float]:
+    """
+    Deflated Sharpe ratio of each column of `returns` given the Sharpe ratios of all trials.
+
+    Parameters
+    ----------
+    sharpe : tp.Array1d
+        Annualized Sharpe ratio of each column.
+    returns : tp.Array2d
+        Returns, one column per candidate.
+    trial_sharpes : tp.Array1d
+        Annualized Sharpe ratios of all combinations of the sweep (NaN ignored).
+    ann_factor : int
+        Annualization factor.
+
+    Returns
+    -------
+    tp.Tuple[tp.Array1d, float]
+        Probability that the true Sharpe ratio of each column exceeds the expected maximum
+        Sharpe ratio of the trials under the null, and that expected maximum (annualized).
+    """
+    normal = NormalDist()
+    scale = math.sqrt(ann_factor)
+    trials = trial_sharpes[~np.isnan(trial_sharpes)] / scale
+    n_trials = len(trials)
+    if n_trials > 1:
+        # Expected maximum of n_trials standard normals (Euler-Mascheroni approximation)
+        gamma = 0.5772156649015329
+        max_z = (1 - gamma) * normal.inv_cdf(1 - 1 / n_trials) + gamma * normal.inv_cdf(1 - 1 / (n_trials * math.e))
+        sr0 = math.sqrt(np.var(trials, ddof=1)) * max_z
+    else:
+        sr0 = 0.0
+
+    sr = np.asarray(sharpe) / scale
+    n = returns.shape[0]
+    centered = returns - returns.mean(axis=0)
+    std = centered.std(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        skew = (centered ** 3).mean(axis=0) / std ** 3
+        kurt = (centered ** 4).mean(axis=0) / std ** 4
+        z = (sr - sr0) * math.sqrt(n - 1) / np.sqrt(1 - skew * sr + (kurt - 1) / 4 * sr ** 2)
+    dsr = np.array([normal.cdf(v) if np.isfinite(v) else np.nan for v in z])
+    return dsr, sr0 * scale
+
+
+def pipeline_significance_nb(
+    close: tp.Array1d,
+    result: SweepResult,
+    ann_factor: int,
+    k: int = 20,
+    n_resamples: int = 1000,
+    block_len: float = 20.0,
+    method: str = "stationary",
+    ci: float = 0.95,
+    seed: int = 0,
+    metric: tp.Optional[str] = None,
+    policy: tp.Optional[ExecutionPolicy] = None
+) -> SignificanceResult:
+    """
+    Test the significance of the top-K combinations of a sweep.
+
+    Parameters
+    ----------
+    close : tp.Array1d
+        Close prices of the sweep.
+    result : SweepResult
+        Sweep result with a Sharpe ratio metric (e.g. `pipeline_chunked_nb(..., to_sweep_result=True)`).
+    ann_factor : int
+        Annualization factor of the sweep.
+    k : int, optional
+        Number of best combinations to test, by default 20.
+    n_resamples : int, optional
+        Number of bootstrap resamples per combination, by default 1000.
+    block_len : float, optional
+        Mean ("stationary") or fixed ("block") block length in bars, by default 20.
+    method : str, optional
+        Bootstrap method: "stationary" or "block", by default "stationary".
+    ci : float, optional
+        Coverage of the bootstrap confidence interval, by default 0.95.
+    seed : int, optional
+        Seed of the random streams, by default 0.
+    metric : str, optional
+        Sharpe ratio metric of the result, by default its first metric.
+    policy : ExecutionPolicy, optional
+        The kernel level sets the number of Numba threads of the bootstrap (restored on exit),
+        by default None (all cores at the kernel level).
+
+    Returns
+    -------
+    SignificanceResult
+        Bootstrap and deflated Sharpe ratio statistics of the top-K combinations.
+
+    Examples
+    --------
+    >>> result = pipeline_chunked_nb(close, default_vbt_params, ann_factor, to_sweep_result=True)
+    >>> sig = pipeline_significance_nb(close, result, ann_factor, k=10, n_resamples=5000)
+    >>> sig.deflated_sharpe, sig.p_value
+    """
+    if method not in ("stationary", "block"):
+        raise ValueError(f"Invalid method: '{method}', must be 'stationary' or 'block'")
+    metric = metric if metric is not None else result.metric_names[0]
+    top = result.top_k(k, metric)
+    params = top.params
+
+    returns = get_sweep_returns(close, params)
+    stationary = method == "stationary"
+    with (policy if policy is not None else ExecutionPolicy.for_layer("kernel")).apply():
+        boot_sharpes = bootstrap_sharpe_nb(returns, n_resamples, float(block_len), stationary, ann_factor, seed)
+        null_sharpes = bootstrap_sharpe_nb(
+            returns - returns.mean(axis=0), n_resamples, float(block_len), stationary, ann_factor, seed)
+    sharpe = top.metrics[metric]
+    deflated, expected_max_sharpe = deflated_sharpe_ratio(sharpe, returns, result.metrics[metric], ann_factor)
+
+    tail = (1 - ci) / 2
+    return SignificanceResult(
+        params=params,
+        sharpe=sharpe,
+        boot_sharpes=boot_sharpes,
+        p_value=(1 + np.sum(null_sharpes >= sharpe, axis=0)) / (1 + n_resamples),
+        prob_nonpositive=np.mean(~(boot_sharpes > 0), axis=0),
+        ci_lower=np.nanquantile(boot_sharpes, tail, axis=0),
+        ci_upper=np.nanquantile(boot_sharpes, 1 - tail, axis=0),
+        deflated_sharpe=deflated,
+        expected_max_sharpe=expected_max_sharpe,
+        n_trials=int(np.sum(~np.isnan(result.metrics[metric])))
+    )
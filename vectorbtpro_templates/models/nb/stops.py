@@ -0,0 +1,152 @@
+import numpy as np
+import numba as nb
+import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.config import stop_param_names
+from vectorbtpro_templates.models.nb.chunking import get_param_arrays_nb, make_chunked
+from vectorbtpro_templates.models.nb.strategies import get_signals_nb
+
+__all__ = [
+    "simulate_stops_nb",
+    "pipeline_stops_nb",
+    "chunked_stops_func_nb",
+    "chunked_stops_wrapper_nb",
+]
+
+
+# Fast Simulation with Stop-Loss/Take-Profit
+# ------------------------------------------
+# `from_basic_signals_nb` is the ultrafast path of vbt, but only applies when there are
+# no stop or limit orders. Moving to the generic `from_signal_func_nb` to sweep stops
+# slows every sweep down sharply. This dedicated simulator covers the case of
+# `get_portfolio_nb` (long-only, all cash in, no fees) with fixed-percentage stops,
+# following the vbt conventions when only close prices are available:
+# - Stops are armed from the bar following the entry, with the entry price (close) as reference.
+# - A stop is hit when the close crosses its level, and the position is exited at the stop price.
+# - Priority: stop-loss, then trailing stop-loss, then take-profit.
+# - The trailing peak is updated with the close after the stops are checked.
+# - User signals are ignored in the bar where a stop is hit.
+# - A bar with both an entry and an exit signal is ignored (same as `from_basic_signals_nb`).
+# - NaN disables a stop.
+# Fees, fixed sizes and the other `PortConfig` settings are not supported: positions are
+# all-in with the whole cash, without costs.
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def simulate_stops_nb(
+    close: tp.Array1d,
+    entries: tp.Array1d,
+    exits: tp.Array1d,
+    sl_stop: float,
+    tp_stop: float,
+    tsl_stop: float,
+    init_cash: float = 100.0
+) -> tp.Array1d:
+    """Backtest a **single** long-only strategy with fixed-percentage SL/TP/TSL (all-in, no fees).
+
+    Returns the returns of the portfolio value (same as `in_outputs.returns` of `get_portfolio_nb`)."""
+    returns = np.empty(close.shape[0], dtype=vbt.float_)
+    cash = init_cash
+    shares = 0.0
+    entry_price = np.nan
+    peak = np.nan
+    prev_value = init_cash
+
+    for i in range(close.shape[0]):
+        stop_hit = False
+        if shares > 0:
+            exit_price = np.nan
+            if not np.isnan(sl_stop) and close[i] <= entry_price * (1 - sl_stop):
+                exit_price = entry_price * (1 - sl_stop)
+            elif not np.isnan(tsl_stop) and close[i] <= peak * (1 - tsl_stop):
+                exit_price = peak * (1 - tsl_stop)
+            elif not np.isnan(tp_stop) and close[i] >= entry_price * (1 + tp_stop):
+                exit_price = entry_price * (1 + tp_stop)
+            if not np.isnan(exit_price):
+                cash += shares * exit_price
+                shares = 0.0
+                stop_hit = True
+            elif close[i] > peak:
+                peak = close[i]
+
+        if not stop_hit and not (entries[i] and exits[i]):
+            if shares > 0 and exits[i]:
+                cash += shares * close[i]
+                shares = 0.0
+            elif shares == 0 and entries[i]:
+                shares = cash / close[i]
+                cash = 0.0
+                entry_price = close[i]
+                peak = close[i]
+
+        value = cash + shares * close[i]
+        returns[i] = value / prev_value - 1
+        prev_value = value
+    return returns
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def pipeline_stops_nb(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float,
+    sl_stop: float,
+    tp_stop: float,
+    tsl_stop: float,
+    ann_factor: int,
+) -> float:
+    """Backtest a **single** strategy with stops and calculate its Sharpe ratio (same as `get_metrics_nb`)."""
+    entries, exits = get_signals_nb(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    returns = simulate_stops_nb(close, entries, exits, sl_stop, tp_stop, tsl_stop)
+    return vbt.ret_nb.sharpe_ratio_1d_nb(returns, ann_factor, ddof=1)
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def chunked_stops_func_nb(
+    n_params: int,
+    close: tp.Array1d,
+    fastperiod: tp.FlexArray1dLike,
+    slowperiod: tp.FlexArray1dLike,
+    signalperiod: tp.FlexArray1dLike,
+    timeperiod: tp.FlexArray1dLike,
+    window: tp.FlexArray1dLike,
+    alpha: tp.FlexArray1dLike,
+    sl_stop: tp.FlexArray1dLike,
+    tp_stop: tp.FlexArray1dLike,
+    tsl_stop: tp.FlexArray1dLike,
+    ann_factor: int
+) -> tp.Array1d:
+    """Backtest **multiple** strategies with stops (same as `chunked_func_nb` with extra stop axes)."""
+    fastperiod_, slowperiod_, signalperiod_, timeperiod_, window_, alpha_ = get_param_arrays_nb(
+        fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    sl_stop_ = vbt.to_1d_array_nb(np.asarray(sl_stop))
+    tp_stop_ = vbt.to_1d_array_nb(np.asarray(tp_stop))
+    tsl_stop_ = vbt.to_1d_array_nb(np.asarray(tsl_stop))
+
+    metrics = np.empty(n_params, dtype=vbt.float_)
+
+    for i in range(n_params):
+        metrics[i] = pipeline_stops_nb(
+            close,
+            fastperiod=vbt.flex_select_1d_nb(fastperiod_, i),
+            slowperiod=vbt.flex_select_1d_nb(slowperiod_, i),
+            signalperiod=vbt.flex_select_1d_nb(signalperiod_, i),
+            timeperiod=vbt.flex_select_1d_nb(timeperiod_, i),
+            window=vbt.flex_select_1d_nb(window_, i),
+            alpha=vbt.flex_select_1d_nb(alpha_, i),
+            sl_stop=vbt.flex_select_1d_nb(sl_stop_, i),
+            tp_stop=vbt.flex_select_1d_nb(tp_stop_, i),
+            tsl_stop=vbt.flex_select_1d_nb(tsl_stop_, i),
+            ann_factor=ann_factor
+        )
+    return metrics
+
+
+# Split pipeline into chunks
+chunked_stops_wrapper_nb = make_chunked(chunked_stops_func_nb, sliced_args=stop_param_names)
+"""Wrap `chunked_stops_func_nb` with the @chunked decorator (see `chunked_wrapper_nb`)."""
@@ -1,8 +1,11 @@
+import numpy as np
 import numba as nb
 import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
-__all__ = ["get_signals_nb"]
+from vectorbtpro_templates.utils import pack_bits_nb
+
+__all__ = ["get_signals_nb", "reduce_signals_nb", "get_packed_signals_nb"]
 
 
 # Custom Signal Generation Function
@@ -68,3 +71,42 @@ def get_signals_nb(
         (close, window=window, alpha=alpha)
     )
     return strategy_nb(close, macd, signal, rsi, upperband, lowerband)
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def reduce_signals_nb(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float,
+    reduce_func_nb: tp.Callable,
+    reduce_args: tp.Tuple = ()
+) -> tp.Array1d:
+    """Generate signals and reduce them on the fly with a Numba-compiled `reduce_func_nb`.
+
+    `reduce_func_nb` must take `(close, entries, exits, *reduce_args)` and return a float
+    (typically simulation plus metric). Signals only live for the duration of the call,
+    and a single-element array is returned, so that the indicator factory stacks one
+    scalar per parameter combination instead of full entry and exit matrices."""
+    entries, exits = get_signals_nb(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    out = np.empty(1, dtype=np.float64)
+    out[0] = reduce_func_nb(close, entries, exits, *reduce_args)
+    return out
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_packed_signals_nb(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float
+) -> tp.Tuple[tp.Array1d, tp.Array1d]:
+    """Generate entry and exit signals packed into bits (8 bars per byte, see `pack_bits_nb`)."""
+    entries, exits = get_signals_nb(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    return pack_bits_nb(entries), pack_bits_nb(exits)
@@ -3,10 +3,19 @@ import optuna
 import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
-from vectorbtpro_templates.models.talib.pipelines import pipeline_talib
+from vectorbtpro_templates.results import SweepResult
+from vectorbtpro_templates.models.talib.pipelines import pipeline_talib, pipeline_talib_array
 from vectorbtpro_templates.models.nb.pipelines import pipeline_nb
 
-__all__ = ["optuna_objective_talib", "optuna_objective_nb"]
+__all__ = [
+    "default_search_space",
+    "suggest_params",
+    "search_space_params",
+    "warm_start_study",
+    "optuna_objective_talib",
+    "optuna_objective_talib_array",
+    "optuna_objective_nb",
+]
 
 # Disable Optuna logging entirely
 optuna.logging.disable_default_handler()
@@ -19,17 +28,179 @@ optuna.logging.set_verbosity(optuna.logging.CRITICAL)
 # It is extensively used for hyperparamter optimization.
 # https://optuna.org/
 
+# Search Space
+# ------------
+# Shared by the objectives below and by the warm start from grid sweeps.
+
+default_search_space = dict(
+    fastperiod=optuna.distributions.IntDistribution(5, 15),
+    slowperiod=optuna.distributions.IntDistribution(20, 30),
+    signalperiod=optuna.distributions.IntDistribution(3, 13),
+    timeperiod=optuna.distributions.IntDistribution(2, 12),
+    window=optuna.distributions.IntDistribution(5, 10),
+    alpha=optuna.distributions.FloatDistribution(0.5, 2.3, step=0.2),
+)
+
+
+def suggest_params(
+    trial: optuna.Trial,
+    search_space: tp.Optional[tp.Dict[str, optuna.distributions.BaseDistribution]] = None
+) -> tp.Dict[str, tp.Any]:
+    """Suggest a value for each parameter of the search space."""
+    params = {}
+    for name, dist in (search_space or default_search_space).items():
+        if isinstance(dist, optuna.distributions.IntDistribution):
+            params[name] = trial.suggest_int(name, dist.low, dist.high, step=dist.step, log=dist.log)
+        elif isinstance(dist, optuna.distributions.FloatDistribution):
+            params[name] = trial.suggest_float(name, dist.low, dist.high, step=dist.step, log=dist.log)
+        else:
+            params[name] = trial.suggest_categorical(name, dist.choices)
+    return params
+
+
+def search_space_params(
+    search_space: tp.Optional[tp.Dict[str, optuna.distributions.BaseDistribution]] = None,
+    stride: int = 1
+) -> tp.Dict[str, vbt.Param]:
+    """Grid covering the search space, keeping every `stride`-th value of each axis (coarse sweep).
+
+    Only discrete distributions (integer, stepped float, categorical) can be mapped to a grid."""
+    params = {}
+    for name, dist in (search_space or default_search_space).items():
+        if isinstance(dist, optuna.distributions.CategoricalDistribution):
+            values = np.asarray(dist.choices)
+        elif dist.step is None or dist.log:
+            raise ValueError(f"Cannot map the continuous distribution of '{name}' to a grid")
+        else:
+            n_steps = int(round((dist.high - dist.low) / dist.step))
+            values = dist.low + np.arange(n_steps + 1) * dist.step
+            if isinstance(dist, optuna.distributions.FloatDistribution):
+                values = np.round(values, 10)
+        params[name] = vbt.Param(values[::stride])
+    return params
+
+
+def _to_search_space(
+    value: tp.Any,
+    dist: optuna.distributions.BaseDistribution
+) -> tp.Optional[tp.Any]:
+    """Value of a grid axis in the search space, or None if it is not a point of the distribution.
+
+    Values are never snapped to the step: the metric of the grid combination is only valid
+    for the exact parameters it was computed with."""
+    value = value.item() if isinstance(value, np.generic) else value
+    if isinstance(dist, optuna.distributions.CategoricalDistribution):
+        return value if value in dist.choices else None
+    if not (dist.low <= value <= dist.high or np.isclose(value, dist.low) or np.isclose(value, dist.high)):
+        return None
+    if isinstance(dist, optuna.distributions.IntDistribution):
+        if not float(value).is_integer() or (int(value) - dist.low) % dist.step != 0:
+            return None
+        return int(value)
+    if dist.step is not None and not np.isclose(value, dist.low + round((value - dist.low) / dist.step) * dist.step):
+        return None
+    return float(min(max(value, dist.low), dist.high))  # <- Only absorbs rounding errors at the bounds
+
+
+def warm_start_study(
+    study: optuna.Study,
+    result: SweepResult,
+    k: int = 20,
+    metric: tp.Optional[str] = None,
+    search_space: tp.Optional[tp.Dict[str, optuna.distributions.BaseDistribution]] = None
+) -> int:
+    """
+    Seed a study with the top-K combinations of a grid sweep as completed trials.
+
+    Known metrics are added with `study.add_trials` and never re-evaluated. They also count
+    as start-up trials of the TPE sampler, which models the space from the first new trial.
+    Grid axes outside the search space are ignored, and combinations with a value that is
+    not a point of the search space (outside its range or off its step) or already in the
+    study are skipped.
+
+    Parameters
+    ----------
+    study : optuna.Study
+        Study to seed (single objective).
+    result : SweepResult
+        Sweep result, e.g. `pipeline_chunked_nb(..., to_sweep_result=True)`.
+    k : int, optional
+        Number of best combinations to add, by default 20.
+    metric : str, optional
+        Metric used as trial value, by default the first metric of the result.
+    search_space : tp.Dict[str, optuna.distributions.BaseDistribution], optional
+        Search space of the objective, by default `default_search_space`.
+
+    Returns
+    -------
+    int
+        Number of trials added.
+
+    Examples
+    --------
+    >>> result = pipeline_chunked_nb(close, search_space_params(stride=2), ann_factor, to_sweep_result=True)
+    >>> study = optuna.create_study(**default_optuna_study)
+    >>> warm_start_study(study, result, k=20)
+    >>> study.optimize(optuna_objective_nb(close), n_trials=50)
+    """
+    search_space = search_space or default_search_space
+    missing = [name for name in search_space if name not in result.grid.names]
+    if missing:
+        raise ValueError(f"Search space parameters {missing} are not axes of the sweep")
+    metric = metric if metric is not None else result.metric_names[0]
+    # Rank positions (the grid index is replaced by positions), negated when minimizing
+    sign = -1 if study.direction == optuna.study.StudyDirection.MINIMIZE else 1
+    ranking = SweepResult(
+        metrics={metric: sign * result.metrics[metric]},
+        grid=result.grid._replace(index=np.arange(result.n_params))
+    )
+    top = result.select(ranking.top_k(k).grid.index)
+
+    params = top.params
+    seen = {tuple(sorted(trial.params.items())) for trial in study.trials}
+    trials = []
+    for i, value in enumerate(top.metrics[metric]):
+        trial_params = {name: _to_search_space(params[name][i], dist) for name, dist in search_space.items()}
+        key = tuple(sorted(trial_params.items()))
+        if any(v is None for v in trial_params.values()) or key in seen:
+            continue
+        seen.add(key)
+        trials.append(optuna.trial.create_trial(
+            params=trial_params,
+            distributions=search_space,
+            value=float(value),
+            user_attrs=dict(warm_start=True)
+        ))
+    study.add_trials(trials)
+    return len(trials)
+
+
+# Objectives
+# ----------
+
+
 def optuna_objective_talib(data: vbt.Data):
     def objective(trial: optuna.Trial) -> float:
         """Maximize sharpe ratio using TA-Lib."""
         metric = pipeline_talib(
             data,
-            fastperiod=trial.suggest_int('fastperiod', 5, 15),
-            slowperiod=trial.suggest_int('slowperiod', 20, 30),
-            signalperiod=trial.suggest_int('signalperiod', 3, 13),
-            timeperiod=trial.suggest_int('timeperiod', 2, 12),
-            window=trial.suggest_int('window', 5, 10),
-            alpha=trial.suggest_float('alpha', 0.5, 2.3, step=0.2),
+            **suggest_params(trial),
+        )
+        if np.isnan(metric):
+            raise optuna.TrialPruned()
+            # See: https://optuna.readthedocs.io/en/stable/reference/generated/optuna.TrialPruned.html
+
+        return metric
+    return objective
+
+
+def optuna_objective_talib_array(close: tp.Array1d):
+    def objective(trial: optuna.Trial) -> float:
+        """Maximize sharpe ratio using TA-Lib on raw NumPy arrays (no Portfolio object per trial)."""
+        metric = pipeline_talib_array(
+            close,
+            **suggest_params(trial),
+            ann_factor=vbt.pd_acc.returns.get_ann_factor(freq='D')
         )
         if np.isnan(metric):
             raise optuna.TrialPruned()
@@ -44,12 +215,7 @@ def optuna_objective_nb(close: tp.Array1d):
         """Maximize sharpe ratio using Number-compiled functions."""
         metric = pipeline_nb(
             close,
-            fastperiod=trial.suggest_int('fastperiod', 5, 15),
-            slowperiod=trial.suggest_int('slowperiod', 20, 30),
-            signalperiod=trial.suggest_int('signalperiod', 3, 13),
-            timeperiod=trial.suggest_int('timeperiod', 2, 12),
-            window=trial.suggest_int('window', 5, 10),
-            alpha=trial.suggest_float('alpha', 0.5, 2.3, step=0.2),
+            **suggest_params(trial),
             ann_factor=vbt.pd_acc.returns.get_ann_factor(freq='D')
         )
         if np.isnan(metric):
@@ -1,9 +1,14 @@
 import vectorbtpro as vbt
 
-from vectorbtpro_templates.models.talib.strategies import get_signals
-from vectorbtpro_templates.config import default_single_params
+from vectorbtpro_templates.models.talib.strategies import (
+    get_signals,
+    reduce_signals,
+    get_packed_signals
+)
+from vectorbtpro_templates.models.nb.pipelines import reduce_sharpe_nb
+from vectorbtpro_templates.config import default_single_params, default_execution_policy
 
-__all__ = ["StrategyTALib"]
+__all__ = ["StrategyTALib", "StrategyTALibReduced", "StrategyTALibPacked"]
 
 
 # Strategy Configuration with Indicator Factory
@@ -19,9 +24,45 @@ StrategyTALib = vbt.IF(
 ).with_apply_func(
     get_signals,  # <- TA-Lib
     takes_1d=True,  # <- Single asset
-    execute_kwargs=dict(engine='threadpool', chunk_len='auto'),
+    execute_kwargs=default_execution_policy.execute_kwargs,
     **default_single_params
 )
 """Defines a custom indicator using the vbt `IndicatorFactory` using TA-Lib, enabling parameterized optimization.
 
 Source: https://vectorbt.pro/pvt_1606a55a/tutorials/superfast-supertrend/#indicator-factory"""
+
+
+StrategyTALibReduced = vbt.IF(
+    class_name='StrategyTALibReduced',
+    short_name='st_reduced',
+    input_names=['close'],
+    param_names=list(default_single_params),
+    output_names=['metric']
+).with_apply_func(
+    reduce_signals,  # <- TA-Lib
+    takes_1d=True,  # <- Single asset
+    execute_kwargs=default_execution_policy.execute_kwargs,
+    reduce_func_nb=reduce_sharpe_nb,  # <- Default reducer (simulation + Sharpe ratio)
+    **default_single_params
+)
+"""Defines a reduce-on-the-fly custom indicator using TA-Lib: signals are reduced to one metric per
+parameter combination inside the apply loop, so that the entry and exit matrices never exist in memory.
+
+Must be run with `return_raw=True` (see `run_reduced`), since the output has one row instead of one per bar."""
+
+
+StrategyTALibPacked = vbt.IF(
+    class_name='StrategyTALibPacked',
+    short_name='st_packed',
+    input_names=['close'],
+    param_names=list(default_single_params),
+    output_names=['entries', 'exits']
+).with_apply_func(
+    get_packed_signals,  # <- TA-Lib
+    takes_1d=True,  # <- Single asset
+    execute_kwargs=default_execution_policy.execute_kwargs,
+    **default_single_params
+)
+"""Defines a custom indicator using TA-Lib emitting bit-packed entry and exit signals (8x smaller than boolean matrices).
+
+Must be run with `return_raw=True` (see `run_packed`), since outputs have `(n_bars + 7) // 8` rows."""
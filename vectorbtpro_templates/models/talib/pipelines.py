@@ -1,10 +1,15 @@
+import numpy as np
+import numba as nb
 import vectorbtpro as vbt
+import vectorbtpro._typing as tp  # -> vbt typing extension
 
 from vectorbtpro_templates.models.talib.custom_indicators import StrategyTALib
+from vectorbtpro_templates.models.talib.strategies import get_signals
+from vectorbtpro_templates.models.nb.pipelines import get_metrics_nb
 from vectorbtpro_templates.config import default_port_kwargs
 
 
-__all__ = ["pipeline_talib"]
+__all__ = ["pipeline_talib", "get_portfolio_from_config_nb", "pipeline_talib_array"]
 
 # Pipeline Function for Sharpe Ratio Optimization
 # -----------------------------------------------
@@ -39,3 +44,67 @@ def pipeline_talib(
     return pf.sharpe_ratio
     # except Exception:
     #     return vbt.NoResult
+
+
+# Array-Only Pipeline Function
+# ----------------------------
+# `pipeline_talib` builds a pandas-backed indicator and a full `vbt.Portfolio` object
+# just to read its Sharpe ratio. The array-only variant feeds TA-Lib indicators into
+# `strategy_nb`, then the Numba basic-signals simulator and a Numba Sharpe ratio.
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_portfolio_from_config_nb(
+    close: tp.Array1d,
+    entries: tp.Array1d,
+    exits: tp.Array1d,
+    init_cash: float,
+    size: float,
+    size_type: int,
+    fees: float
+) -> tp.NamedTuple:
+    """Backtest a **single** strategy with the portfolio parameters of `PortConfig`.
+
+    Source: https://vectorbt.pro/pvt_1606a55a/api/portfolio/nb/from_signals/"""
+    return vbt.pf_nb.from_basic_signals_nb(
+        target_shape=(close.shape[0], 1),
+        group_lens=np.array([1]),
+        auto_call_seq=True,
+        init_cash=init_cash,
+        close=close,
+        long_entries=entries,
+        long_exits=exits,
+        size=size,
+        size_type=size_type,
+        fees=fees,
+        save_returns=True,  # Pre-calculate the returns
+    )
+
+
+def pipeline_talib_array(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float,
+    ann_factor: int,
+    port_kwargs: tp.Optional[tp.Dict[str, tp.Any]] = None
+) -> float:
+    """Backtest a **single** strategy with TA-Lib on raw NumPy arrays, without pandas or `vbt.Portfolio` objects.
+
+    Honors `PortConfig` (`init_cash`, `size`, `fees`, `size_type`) and returns the same
+    Sharpe ratio as `pipeline_talib` with `ann_factor` matching the frequency of the data."""
+    port_kwargs = default_port_kwargs if port_kwargs is None else port_kwargs
+    entries, exits = get_signals(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    sim_out = get_portfolio_from_config_nb(
+        close,
+        entries,
+        exits,
+        init_cash=float(port_kwargs['init_cash']),
+        size=float(port_kwargs['size']),
+        size_type=vbt.map_enum_fields(port_kwargs['size_type'], vbt.pf_enums.SizeType),
+        fees=float(port_kwargs['fees'])
+    )
+    return get_metrics_nb(sim_out, ann_factor)
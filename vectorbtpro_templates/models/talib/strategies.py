@@ -1,8 +1,11 @@
+import numpy as np
 import numba as nb
 import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
-__all__ = ["get_signals"]
+from vectorbtpro_templates.utils import pack_bits_nb
+
+__all__ = ["get_signals", "reduce_signals", "get_packed_signals"]
 
 
 # Custom Signal Generation Function
@@ -67,3 +70,36 @@ def get_signals(
         (close, timeperiod=window, nbdevup=alpha, nbdevdn=alpha)
     )
     return strategy_nb(close, macd, signal, rsi, upperband, lowerband)
+
+
+def reduce_signals(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float,
+    reduce_func_nb: tp.Callable,
+    reduce_args: tp.Tuple = ()
+) -> tp.Array1d:
+    """Generate signals using TA-Lib and reduce them on the fly with a Numba-compiled `reduce_func_nb`.
+
+    `reduce_func_nb` must take `(close, entries, exits, *reduce_args)` and return a float.
+    Returns a single-element array (one scalar per parameter combination)."""
+    entries, exits = get_signals(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    return np.array([reduce_func_nb(close, entries, exits, *reduce_args)], dtype=np.float64)
+
+
+def get_packed_signals(
+    close: tp.Array1d,
+    fastperiod: int,
+    slowperiod: int,
+    signalperiod: int,
+    timeperiod: int,
+    window: int,
+    alpha: float
+) -> tp.Tuple[tp.Array1d, tp.Array1d]:
+    """Generate entry and exit signals using TA-Lib, packed into bits (8 bars per byte, see `pack_bits_nb`)."""
+    entries, exits = get_signals(close, fastperiod, slowperiod, signalperiod, timeperiod, window, alpha)
+    return pack_bits_nb(entries), pack_bits_nb(exits)
@@ -0,0 +1,138 @@
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import vectorbtpro._typing as tp  # -> vbt typing extension
+
+from vectorbtpro_templates.grid import ParamGrid
+
+__all__ = ["SweepResult"]
+
+
+# Compact Sweep Result
+# --------------------
+# A pandas Series with a six-level MultiIndex costs far more memory than the float
+# metrics it indexes, and per-parameter questions turn into slow groupbys. The result
+# only stores metric arrays plus the grid (per-axis values and flat indices into the
+# Cartesian product). Parameter positions are decoded with index arithmetic, and
+# aggregations are computed with `np.bincount` over the decoded positions.
+
+
+_AGGREGATIONS = ("mean", "sum", "count", "min", "max")
+
+
+class SweepResult(tp.NamedTuple):
+    """Metric arrays of a sweep and the parameter grid they were computed on.
+
+    Each metric array is aligned with `grid.index`."""
+    metrics: tp.Dict[str, tp.Array1d]
+    grid: ParamGrid
+
+    @property
+    def n_params(self) -> int:
+        """Number of parameter combinations."""
+        return self.grid.n_params
+
+    @property
+    def metric_names(self) -> tp.List[str]:
+        """Names of the stored metrics."""
+        return list(self.metrics)
+
+    def codes(self, name: str) -> tp.Array1d:
+        """Position of each combination on the axis `name` (decoded from the flat index)."""
+        a = self.grid.names.index(name)
+        shape = self.grid.shape
+        stride = int(np.prod(shape[a + 1:], dtype=np.int64))
+        return (self.grid.index // stride) % shape[a]
+
+    @property
+    def params(self) -> tp.Dict[str, tp.Array1d]:
+        """Parameter values of each combination."""
+        return {name: values[self.codes(name)] for name, values in zip(self.grid.names, self.grid.values)}
+
+    def _get_metric(self, metric: tp.Optional[str]) -> tp.Array1d:
+        """Metric array by name (the first metric by default)."""
+        return self.metrics[metric if metric is not None else self.metric_names[0]]
+
+    def _aggregate(self, codes: tp.Array1d, n_groups: int, metric: tp.Optional[str], agg: str) -> tp.Array1d:
+        """Aggregate a metric per group code, ignoring NaN."""
+        values = self._get_metric(metric)
+        finite = ~np.isnan(values)
+        codes, values = codes[finite], values[finite]
+        if agg in ("mean", "sum", "count"):
+            count = np.bincount(codes, minlength=n_groups).astype(np.float64)
+            if agg == "count":
+                return count
+            total = np.bincount(codes, weights=values, minlength=n_groups)
+            if agg == "sum":
+                return total
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return total / count
+        if agg in ("min", "max"):
+            out = np.full(n_groups, np.inf if agg == "min" else -np.inf)
+            (np.minimum if agg == "min" else np.maximum).at(out, codes, values)
+            out[np.isinf(out)] = np.nan
+            return out
+        raise ValueError(f"Invalid aggregation: '{agg}', must be one of {_AGGREGATIONS}")
+
+    def marginal(self, name: str, metric: tp.Optional[str] = None, agg: str = "mean") -> pd.Series:
+        """Aggregate a metric per value of the parameter `name` (e.g. mean Sharpe per `window`)."""
+        values = self.grid.values[self.grid.names.index(name)]
+        out = self._aggregate(self.codes(name), len(values), metric, agg)
+        return pd.Series(out, index=pd.Index(values, name=name), name=metric or self.metric_names[0])
+
+    def pairwise(self, x: str, y: str, metric: tp.Optional[str] = None, agg: str = "mean") -> pd.DataFrame:
+        """Aggregate a metric per pair of values of parameters `x` (rows) and `y` (columns), e.g. a heatmap."""
+        x_values = self.grid.values[self.grid.names.index(x)]
+        y_values = self.grid.values[self.grid.names.index(y)]
+        codes = self.codes(x) * len(y_values) + self.codes(y)
+        out = self._aggregate(codes, len(x_values) * len(y_values), metric, agg)
+        return pd.DataFrame(
+            out.reshape(len(x_values), len(y_values)),
+            index=pd.Index(x_values, name=x),
+            columns=pd.Index(y_values, name=y)
+        )
+
+    def select(self, positions: tp.Array1d) -> "SweepResult":
+        """Subset of combinations by position (boolean mask or integer positions)."""
+        return SweepResult(
+            metrics={k: v[positions] for k, v in self.metrics.items()},
+            grid=self.grid._replace(index=self.grid.index[positions])
+        )
+
+    def filter(self, mask: tp.Optional[tp.Array1d] = None, **values) -> "SweepResult":
+        """Subset of combinations matching a boolean mask and/or parameter values.
+
+        Examples
+        --------
+        >>> result.filter(window=7, alpha=[0.5, 0.7])
+        >>> result.filter(result.metrics["sharpe_ratio"] > 1)
+        """
+        keep = np.ones(self.n_params, dtype=np.bool_) if mask is None else np.asarray(mask, dtype=np.bool_)
+        for name, allowed in values.items():
+            axis_values = self.grid.values[self.grid.names.index(name)]
+            allowed_codes = np.flatnonzero(np.isin(axis_values, np.atleast_1d(allowed)))
+            keep &= np.isin(self.codes(name), allowed_codes)
+        return self.select(keep)
+
+    def top_k(self, k: int, metric: tp.Optional[str] = None) -> "SweepResult":
+        """Top-K combinations by metric (best first, NaN excluded)."""
+        metric_values = self._get_metric(metric)
+        values = np.where(np.isnan(metric_values), -np.inf, metric_values)
+        k = min(k, len(values))
+        if k == 0:
+            return self.select(np.empty(0, dtype=np.int64))
+        positions = np.argpartition(-values, k - 1)[:k]
+        positions = positions[np.argsort(-values[positions], kind="stable")]
+        return self.select(positions[~np.isnan(metric_values[positions])])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Flat DataFrame with one column per parameter and metric (no MultiIndex)."""
+        return pd.DataFrame({**self.params, **self.metrics})
+
+    def to_parquet(self, path: str | Path, **kwargs) -> None:
+        """Export the flat DataFrame to Parquet (requires `pyarrow` or `fastparquet`)."""
+        self.to_frame().to_parquet(path, index=False, **kwargs)
+
+    def to_pd_series(self, metric: tp.Optional[str] = None) -> pd.Series:
+        """Metric as a pandas Series with a MultiIndex of parameters (costly for large sweeps)."""
+        return pd.Series(self._get_metric(metric), index=self.grid.param_index, name=metric or self.metric_names[0])
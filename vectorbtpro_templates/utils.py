@@ -1,8 +1,19 @@
+from pathlib import Path
 import numpy as np
+import pandas as pd
 import numba as nb
+import vectorbtpro as vbt
 import vectorbtpro._typing as tp  # -> vbt typing extension
 
-__all__ = ["np_list_arange"]
+__all__ = [
+    "np_list_arange",
+    "pack_bits_nb",
+    "get_packed_bit_nb",
+    "unpack_bits_nb",
+    "PackedSignals",
+    "run_reduced",
+    "run_packed",
+]
 
 
 @nb.njit
@@ -64,3 +75,157 @@ def np_list_arange(
     range_[0] = start
     range_[-1] = stop - step
     return range_
+
+
+# Bit-Packed Signals
+# ------------------
+# Boolean signals are stored as one byte per bool. Packing them along the bar axis,
+# 8 bars per byte (bit `i & 7` of byte `i >> 3`, same layout as
+# `np.packbits(..., bitorder="little")`), makes signal matrices 8x smaller.
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def pack_bits_nb(arr: tp.Array1d) -> tp.Array1d:
+    """Pack a one-dimensional boolean array into an array of `uint8` (8 values per byte)."""
+    n = arr.shape[0]
+    out = np.zeros((n + 7) // 8, dtype=np.uint8)
+    for i in range(n):
+        if arr[i]:
+            out[i >> 3] |= np.uint8(1 << (i & 7))
+    return out
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def get_packed_bit_nb(packed: tp.Array2d, i: int, col: int) -> bool:
+    """Read the value at row `i` and column `col` of a packed signal matrix."""
+    return (packed[i >> 3, col] >> (i & 7)) & 1 == 1
+
+
+@nb.njit(nogil=True)  # <- nogil enabled allows multithreading
+def unpack_bits_nb(packed: tp.Array2d, col: int, out: tp.Array1d) -> tp.Array1d:
+    """Unpack a single column of a packed signal matrix into a preallocated boolean array.
+
+    Only `out.shape[0]` rows are read, so that the same buffer can be reused across
+    columns without unpacking the whole matrix."""
+    for i in range(out.shape[0]):
+        out[i] = (packed[i >> 3, col] >> (i & 7)) & 1 == 1
+    return out
+
+
+class PackedSignals(tp.NamedTuple):
+    """Bit-packed entry and exit signal matrices of shape `((n_rows + 7) // 8, n_columns)`."""
+    entries: tp.Array2d
+    exits: tp.Array2d
+    n_rows: int
+    param_index: pd.MultiIndex
+
+    def unpack(self) -> tp.Tuple[tp.Array2d, tp.Array2d]:
+        """Unpack both matrices into boolean arrays of shape `(n_rows, n_columns)`."""
+        return tuple(
+            np.unpackbits(arr, axis=0, count=self.n_rows, bitorder="little").astype(bool)
+            for arr in (self.entries, self.exits)
+        )
+
+
+def run_reduced(
+    indicator: tp.Type[vbt.IndicatorBase],
+    close: tp.ArrayLike,
+    reduce_args: tp.Tuple = (),
+    to_pd_series: tp.Optional[bool] = False,
+    **run_kwargs
+) -> tp.Array1d | pd.Series:
+    """
+    Run a reduce-on-the-fly indicator (e.g. `StrategyNumbaReduced`, `StrategyTALibReduced`)
+    and return one metric per parameter combination.
+
+    The indicator is run with `return_raw=True`: its apply function returns a single
+    value per column, which cannot be wrapped into a bar-indexed DataFrame.
+
+    Parameters
+    ----------
+    indicator : tp.Type[vbt.IndicatorBase]
+        Indicator class whose only output is the reduced metric.
+    close : tp.ArrayLike
+        Close prices of a **single** asset.
+    reduce_args : tp.Tuple, optional
+        Extra arguments passed to the reducer after `(close, entries, exits)`,
+        by default ().
+    to_pd_series : bool, optional
+        If True, returns a pandas Series indexed by parameter combinations,
+        by default False.
+    **run_kwargs
+        Parameters and keyword arguments passed to `indicator.run`.
+
+    Returns
+    -------
+    tp.Array1d | pd.Series
+        Metric of each parameter combination.
+
+    Examples
+    --------
+    >>> sharpes = run_reduced(
+    ...     StrategyNumbaReduced,
+    ...     data.close,
+    ...     reduce_args=(ann_factor,),
+    ...     param_product=True,
+    ...     **default_params
+    ... )
+    """
+    outputs, param_list, _, _ = indicator.run(
+        close,
+        reduce_args=reduce_args,
+        return_raw=True,
+        **run_kwargs
+    )
+    # Raw output has shape (1, n_combinations)
+    metrics = np.asarray(outputs[0])[0]
+    if to_pd_series:
+        index = pd.MultiIndex.from_tuples(param_list, names=list(indicator.param_names))  # <- One tuple per combination
+        return pd.Series(metrics, index=index)
+    return metrics
+
+
+def run_packed(
+    indicator: tp.Type[vbt.IndicatorBase],
+    close: tp.ArrayLike,
+    path: tp.Optional[str | Path] = None,
+    **run_kwargs
+) -> PackedSignals:
+    """
+    Run a bit-packed indicator (e.g. `StrategyNumbaPacked`, `StrategyTALibPacked`)
+    and return its packed entry and exit matrices.
+
+    Parameters
+    ----------
+    indicator : tp.Type[vbt.IndicatorBase]
+        Indicator class whose outputs are packed entries and exits.
+    close : tp.ArrayLike
+        Close prices of a **single** asset.
+    path : str | Path, optional
+        If provided, packed signals are loaded from this file if it exists,
+        or saved to it otherwise, by default None.
+    **run_kwargs
+        Parameters and keyword arguments passed to `indicator.run`.
+
+    Returns
+    -------
+    PackedSignals
+        Packed signals, number of bars and parameter index.
+
+    Examples
+    --------
+    >>> packed = run_packed(StrategyNumbaPacked, data.close, param_product=True, **default_params)
+    >>> sharpes = get_packed_metrics_nb(close, packed.entries, packed.exits, ann_factor)
+    """
+    if path is not None and vbt.file_exists(path):
+        return vbt.load(path)
+    outputs, param_list, _, _ = indicator.run(close, return_raw=True, **run_kwargs)
+    packed = PackedSignals(
+        entries=np.asarray(outputs[0]),
+        exits=np.asarray(outputs[1]),
+        n_rows=len(close),
+        param_index=pd.MultiIndex.from_tuples(param_list, names=list(indicator.param_names))
+    )
+    if path is not None:
+        vbt.save(packed, path)
+    return packed